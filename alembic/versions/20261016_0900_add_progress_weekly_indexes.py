@@ -0,0 +1,57 @@
+"""add_progress_weekly_indexes
+
+Revision ID: 3f9a1c7d2b40
+Revises: ad8704a390ce
+Create Date: 2026-10-16 09:00:00.000000
+
+Progress logging used to number weeks as len(progress_entries) + 1 with
+no uniqueness guard, so concurrent submissions could store the same week
+twice. The upgrade does not guess which duplicate to keep: it checks for
+duplicate (goal_id, week_number) pairs first and aborts with a message
+listing them, so they can be reviewed and removed or renumbered by hand
+before re-running the migration.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f9a1c7d2b40'
+down_revision: Union[str, None] = 'ad8704a390ce'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    duplicates = op.get_bind().execute(sa.text("""
+        SELECT goal_id, week_number, count(*)
+        FROM progress_entries
+        GROUP BY goal_id, week_number
+        HAVING count(*) > 1
+        ORDER BY goal_id, week_number
+    """)).all()
+    if duplicates:
+        listed = ", ".join(
+            f"goal {goal_id} week {week} ({count} rows)"
+            for goal_id, week, count in duplicates
+        )
+        raise RuntimeError(
+            "Cannot create unique index ix_progress_goal_week: duplicate "
+            f"progress entries found for {listed}. Remove or renumber them "
+            "and re-run the migration."
+        )
+
+    # Unique (goal_id, week_number): one progress entry per goal week
+    op.create_index(
+        'ix_progress_goal_week',
+        'progress_entries',
+        ['goal_id', 'week_number'],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_progress_goal_week', table_name='progress_entries')
@@ -0,0 +1,86 @@
+"""store_user_enums_as_smallint
+
+Revision ID: 8b2e4d6f1a93
+Revises: 3f9a1c7d2b40
+Create Date: 2026-10-16 09:15:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8b2e4d6f1a93'
+down_revision: Union[str, None] = '3f9a1c7d2b40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Codes follow the declaration order of the Python enums (src/models/enums.py)
+GENDER_VALUES = ('male', 'female')
+CALCULATION_METHOD_VALUES = ('navy', '3_site', '7_site')
+ACTIVITY_LEVEL_VALUES = (
+    'sedentary',
+    'lightly_active',
+    'moderately_active',
+    'very_active',
+    'extremely_active',
+)
+
+COLUMNS = (
+    ('gender', GENDER_VALUES),
+    ('preferred_calculation_method', CALCULATION_METHOD_VALUES),
+    ('activity_level', ACTIVITY_LEVEL_VALUES),
+)
+
+
+def _to_code(column: str, values: tuple[str, ...]) -> str:
+    cases = " ".join(
+        f"WHEN '{value}' THEN {code}" for code, value in enumerate(values)
+    )
+    return f"CASE {column}::text {cases} END"
+
+
+def _to_label(column: str, values: tuple[str, ...]) -> str:
+    cases = " ".join(
+        f"WHEN {code} THEN '{value}'" for code, value in enumerate(values)
+    )
+    return f"CASE {column} {cases} END"
+
+
+def upgrade() -> None:
+    for column, values in COLUMNS:
+        op.execute(
+            f"ALTER TABLE users ALTER COLUMN {column} TYPE smallint "
+            f"USING ({_to_code(column, values)})"
+        )
+        codes = ", ".join(str(code) for code in range(len(values)))
+        op.create_check_constraint(
+            f"users_{column}_check", 'users', f"{column} IN ({codes})"
+        )
+
+    # calculationmethod is still used by body_measurements
+    op.execute('DROP TYPE IF EXISTS gender')
+    op.execute('DROP TYPE IF EXISTS activitylevel')
+
+
+def downgrade() -> None:
+    op.execute("CREATE TYPE gender AS ENUM ('male', 'female')")
+    op.execute(
+        "CREATE TYPE activitylevel AS ENUM ("
+        "'sedentary', 'lightly_active', 'moderately_active', "
+        "'very_active', 'extremely_active')"
+    )
+
+    enum_types = {
+        'gender': 'gender',
+        'preferred_calculation_method': 'calculationmethod',
+        'activity_level': 'activitylevel',
+    }
+    for column, values in COLUMNS:
+        op.drop_constraint(f"users_{column}_check", 'users', type_='check')
+        op.execute(
+            f"ALTER TABLE users ALTER COLUMN {column} TYPE {enum_types[column]} "
+            f"USING ({_to_label(column, values)})::{enum_types[column]}"
+        )
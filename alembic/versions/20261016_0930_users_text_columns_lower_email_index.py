@@ -0,0 +1,78 @@
+"""users_text_columns_lower_email_index
+
+Revision ID: c41d7e2a9f05
+Revises: 8b2e4d6f1a93
+Create Date: 2026-10-16 09:30:00.000000
+
+Registration used to compare emails exactly, so existing rows may hold
+addresses that differ only by letter case. Those accounts would collide
+on the new lower(email) index and be ambiguous at login, and merging
+them means choosing whose goals and measurements survive. The upgrade
+therefore checks for them first and aborts with a message naming the
+duplicates, so they can be resolved by hand before re-running it.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c41d7e2a9f05'
+down_revision: Union[str, None] = '8b2e4d6f1a93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TEXT_COLUMNS = ('email', 'hashed_password', 'full_name')
+
+
+def upgrade() -> None:
+    duplicates = op.get_bind().execute(sa.text("""
+        SELECT lower(email), string_agg(email, ', ' ORDER BY email)
+        FROM users
+        GROUP BY lower(email)
+        HAVING count(*) > 1
+        ORDER BY lower(email)
+    """)).all()
+    if duplicates:
+        listed = "; ".join(emails for _, emails in duplicates)
+        raise RuntimeError(
+            "Cannot create unique index uq_users_email_lower: emails that "
+            f"differ only by case found: {listed}. Merge or rename these "
+            "accounts and re-run the migration."
+        )
+
+    for column in TEXT_COLUMNS:
+        op.alter_column(
+            'users',
+            column,
+            type_=sa.Text(),
+            existing_type=sa.String(length=255),
+            existing_nullable=False,
+        )
+
+    # Replace case-sensitive email uniqueness with a functional index
+    op.execute("DROP INDEX IF EXISTS ix_users_email")
+    op.execute("ALTER TABLE users DROP CONSTRAINT IF EXISTS users_email_key")
+    op.execute("""
+        CREATE UNIQUE INDEX uq_users_email_lower
+        ON users (lower(email))
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS uq_users_email_lower")
+
+    for column in TEXT_COLUMNS:
+        op.alter_column(
+            'users',
+            column,
+            type_=sa.String(length=255),
+            existing_type=sa.Text(),
+            existing_nullable=False,
+        )
+
+    op.create_unique_constraint('users_email_key', 'users', ['email'])
+    op.create_index('ix_users_email', 'users', ['email'], unique=True)
@@ -0,0 +1,54 @@
+"""updated_at_trigger
+
+Revision ID: 5d8e1b3c7a26
+Revises: c41d7e2a9f05
+Create Date: 2026-10-16 09:45:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d8e1b3c7a26'
+down_revision: Union[str, None] = 'c41d7e2a9f05'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TABLES = ('users', 'goals', 'training_plans', 'diet_plans')
+
+
+def upgrade() -> None:
+    op.execute(
+        "CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$ "
+        "BEGIN NEW.updated_at := timezone('utc', now()); RETURN NEW; END "
+        "$$ LANGUAGE plpgsql"
+    )
+    for table in TABLES:
+        op.alter_column(
+            table,
+            'updated_at',
+            server_default=sa.text("timezone('utc', now())"),
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+        )
+        op.execute(
+            f"CREATE TRIGGER {table}_set_updated_at BEFORE UPDATE ON {table} "
+            "FOR EACH ROW EXECUTE FUNCTION set_updated_at()"
+        )
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_set_updated_at ON {table}")
+        op.alter_column(
+            table,
+            'updated_at',
+            server_default=None,
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+        )
+    op.execute("DROP FUNCTION IF EXISTS set_updated_at()")
@@ -0,0 +1,45 @@
+"""training_plan_cardio_frequency
+
+Revision ID: 9e4a6c2f8d13
+Revises: 5d8e1b3c7a26
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9e4a6c2f8d13'
+down_revision: Union[str, None] = '5d8e1b3c7a26'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'training_plans',
+        sa.Column(
+            'cardio_frequency',
+            sa.Integer(),
+            sa.Computed(
+                "(plan_details #>> '{cardio,frequency}')::int", persisted=True
+            ),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        op.f('ix_training_plans_cardio_frequency'),
+        'training_plans',
+        ['cardio_frequency'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        op.f('ix_training_plans_cardio_frequency'), table_name='training_plans'
+    )
+    op.drop_column('training_plans', 'cardio_frequency')
@@ -0,0 +1,39 @@
+"""partial_active_goal_index
+
+Revision ID: 7a3c9e1f4b62
+Revises: 9e4a6c2f8d13
+Create Date: 2026-10-16 10:15:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7a3c9e1f4b62'
+down_revision: Union[str, None] = '9e4a6c2f8d13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Every (user_id, status) lookup asks for the active goal, so index
+    # only those rows; user_id-only lookups use ix_goals_user_started.
+    # CONCURRENTLY can't run inside a transaction.
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_goals_user_active
+            ON goals (user_id)
+            WHERE status = 'ACTIVE'
+        """)
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_goals_user_status")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_goals_user_status
+            ON goals (user_id, status)
+        """)
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_goals_user_active")
@@ -0,0 +1,30 @@
+"""goal_energy_at_creation
+
+Revision ID: 2b6f8d4a1c97
+Revises: 7a3c9e1f4b62
+Create Date: 2026-10-16 10:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2b6f8d4a1c97'
+down_revision: Union[str, None] = '7a3c9e1f4b62'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # BMR/TDEE computed by create_goal; existing goals stay NULL since
+    # their inputs (age, weight at creation) aren't reliably recoverable
+    op.add_column('goals', sa.Column('bmr_at_creation', sa.Integer(), nullable=True))
+    op.add_column('goals', sa.Column('tdee_at_creation', sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('goals', 'tdee_at_creation')
+    op.drop_column('goals', 'bmr_at_creation')
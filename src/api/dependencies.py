@@ -1,13 +1,17 @@
 """
 FastAPI dependencies for authentication and authorization.
 """
-from typing import Annotated
+from datetime import date
+from typing import Annotated, Any, AsyncGenerator, Awaitable, Callable, TypeVar
 from uuid import UUID
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
+from fastapi.exceptions import RequestValidationError
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from pydantic import BaseModel, ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.context import request_today
 from src.core.database import get_db
 from src.core.security import decode_token
 from src.models.user import User
@@ -16,6 +20,8 @@ from src.schemas.user import UserResponse
 # Security scheme for JWT Bearer token
 security = HTTPBearer()
 
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
 
 async def get_current_user(
     credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
@@ -74,19 +80,8 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    # Convert to response schema
-    return UserResponse(
-        id=user.id,
-        email=user.email,
-        full_name=user.full_name,
-        date_of_birth=user.date_of_birth,
-        gender=user.gender,
-        height_cm=user.height_cm,
-        preferred_calculation_method=user.preferred_calculation_method,
-        activity_level=user.activity_level,
-        created_at=user.created_at,
-        updated_at=user.updated_at,
-    )
+    # Convert to response schema (trusted row, no re-validation)
+    return UserResponse.from_orm_trusted(user)
 
 
 async def require_active_goal(
@@ -130,7 +125,62 @@ async def require_active_goal(
     return current_user
 
 
+async def set_request_today() -> AsyncGenerator[None, None]:
+    """
+    Resolve "today" once for the request's date-based validators.
+
+    Only routes whose bodies validate dates (e.g. UserCreate's age check)
+    need this, so it is attached per router rather than in the middleware.
+    Must stay async: sync dependencies run in a threadpool with a copied
+    context, and the value would never reach body validation.
+    """
+    token = request_today.set(date.today())
+    try:
+        yield
+    finally:
+        request_today.reset(token)
+
+
 # Type aliases for dependency injection
 CurrentUser = Annotated[UserResponse, Depends(get_current_user)]
 UserWithActiveGoal = Annotated[UserResponse, Depends(require_active_goal)]
 DatabaseSession = Annotated[AsyncSession, Depends(get_db)]
+
+
+def json_body(model: type[ModelT]) -> Callable[[Request], Awaitable[ModelT]]:
+    """
+    Dependency that validates the raw request body with model_validate_json.
+
+    pydantic-core parses and validates the JSON bytes in a single pass,
+    instead of FastAPI decoding to Python objects first and validating
+    those. Errors are re-raised as RequestValidationError with a "body"
+    location prefix, matching FastAPI's own body validation.
+
+    Pair with json_body_openapi(model) on the route so the request body
+    still appears in the OpenAPI schema.
+    """
+
+    async def dependency(request: Request) -> ModelT:
+        body = await request.body()
+        if not body:
+            raise RequestValidationError(
+                [{"type": "missing", "loc": ("body",), "msg": "Field required", "input": None}]
+            )
+        try:
+            return model.model_validate_json(body)
+        except ValidationError as exc:
+            raise RequestValidationError(
+                [{**error, "loc": ("body", *error["loc"])} for error in exc.errors()]
+            ) from exc
+
+    return dependency
+
+
+def json_body_openapi(model: type[BaseModel]) -> dict[str, Any]:
+    """OpenAPI requestBody entry for a route using json_body(model)."""
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": model.model_json_schema()}},
+        }
+    }
@@ -11,7 +11,7 @@ from typing import AsyncGenerator
 from fastapi import FastAPI, HTTPException, Request, status
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from sqlalchemy import text
 from sqlalchemy.exc import NoResultFound
 
@@ -60,6 +60,9 @@ app = FastAPI(
     description="API for tracking body recomposition goals and progress",
     version="0.1.0",
     lifespan=lifespan,
+    # orjson handles the nested plan_details / meal_timing payloads,
+    # UUIDs and datetimes much faster than the stdlib encoder
+    default_response_class=ORJSONResponse,
 )
 
 
@@ -2,7 +2,7 @@
 Authentication router with login and token refresh endpoints.
 """
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.config import settings
@@ -38,7 +38,9 @@ async def login(
         HTTPException 401: If credentials are invalid
     """
     # Find user by email
-    result = await db.execute(select(User).where(User.email == credentials.email))
+    result = await db.execute(
+        select(User).where(func.lower(User.email) == credentials.email.lower())
+    )
     user = result.scalar_one_or_none()
 
     # Verify credentials
@@ -50,8 +50,11 @@ async def create_measurement(
 
     Returns the created measurement with calculated body fat percentage.
     """
-    # Calculate age from date of birth
-    age = (datetime.utcnow() - current_user.date_of_birth).days // 365
+    # Calculate age in whole years from date of birth (leap-aware:
+    # one less if this year's birthday hasn't happened yet)
+    now = datetime.utcnow()
+    dob = current_user.date_of_birth
+    age = now.year - dob.year - ((now.month, now.day) < (dob.month, dob.day))
 
     # Initialize calculator
     calculator = BodyFatCalculator()
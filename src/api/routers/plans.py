@@ -6,7 +6,7 @@ Provides endpoints for retrieving training and diet plans.
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import lambda_stmt, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.api.dependencies import get_current_user, get_db
@@ -51,8 +51,12 @@ async def get_training_plan(
         )
 
     # Get training plan
+    # lambda_stmt caches the constructed statement; goal_id is extracted
+    # from the closure as a bound parameter on each call
     result = await db.execute(
-        select(TrainingPlan).where(TrainingPlan.goal_id == goal_id)
+        lambda_stmt(
+            lambda: select(TrainingPlan).where(TrainingPlan.goal_id == goal_id)
+        )
     )
     training_plan = result.scalar_one_or_none()
 
@@ -99,7 +103,9 @@ async def get_diet_plan(
         )
 
     # Get diet plan
-    result = await db.execute(select(DietPlan).where(DietPlan.goal_id == goal_id))
+    result = await db.execute(
+        lambda_stmt(lambda: select(DietPlan).where(DietPlan.goal_id == goal_id))
+    )
     diet_plan = result.scalar_one_or_none()
 
     if not diet_plan:
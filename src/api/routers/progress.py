@@ -7,6 +7,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.api.dependencies import json_body, json_body_openapi
 from src.core.database import get_db
 from src.core.deps import get_current_user
 from src.models.user import User
@@ -29,13 +30,15 @@ router = APIRouter(prefix="/goals", tags=["progress"])
     description=(
         "Create a weekly progress entry by linking a new measurement to a goal. "
         "Requires at least 7 days since last entry or goal start."
-    )
+    ),
+    openapi_extra=json_body_openapi(ProgressEntryCreate),
 )
 async def create_progress_entry(
     goal_id: UUID,
-    progress_data: ProgressEntryCreate,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    # Declared after auth so unauthenticated requests still get 401 first
+    progress_data: ProgressEntryCreate = Depends(json_body(ProgressEntryCreate)),
 ) -> ProgressEntryResponse:
     """
     Log a new progress entry for a goal.
@@ -125,7 +128,7 @@ async def get_progress_history(
     Raises:
         404: Goal not found
     """
-    from sqlalchemy import select
+    from sqlalchemy import lambda_stmt, select
     from src.models.progress import ProgressEntry
     from src.models.goal import Goal
     
@@ -141,16 +144,20 @@ async def get_progress_history(
             detail="Goal not found"
         )
     
-    # Get all progress entries ordered by week number
+    # Get all progress entries ordered by week number (cached lambda
+    # statement, goal_id is bound from the closure)
     result = await db.execute(
-        select(ProgressEntry)
-        .where(ProgressEntry.goal_id == goal_id)
-        .order_by(ProgressEntry.week_number)
+        lambda_stmt(
+            lambda: select(ProgressEntry)
+            .where(ProgressEntry.goal_id == goal_id)
+            .order_by(ProgressEntry.week_number)
+        )
     )
     progress_entries = result.scalars().all()
     
+    # Rows come straight from the database, so skip per-field validation
     return [
-        ProgressEntryResponse.model_validate(entry)
+        ProgressEntryResponse.from_orm_trusted(entry)
         for entry in progress_entries
     ]
 
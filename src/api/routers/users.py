@@ -2,16 +2,21 @@
 Users API router for Body Recomp Backend.
 """
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.api.dependencies import set_request_today
 from src.core.database import get_db
 from src.core.deps import get_current_user
 from src.core.security import get_password_hash
 from src.models.user import User
 from src.schemas.user import UserCreate, UserResponse
 
-router = APIRouter(prefix="/users", tags=["users"])
+router = APIRouter(
+    prefix="/users",
+    tags=["users"],
+    dependencies=[Depends(set_request_today)],
+)
 
 
 @router.post(
@@ -41,7 +46,7 @@ async def register_user(
     """
     # Check if email already exists
     result = await db.execute(
-        select(User).where(User.email == user_data.email)
+        select(User).where(func.lower(User.email) == user_data.email.lower())
     )
     existing_user = result.scalar_one_or_none()
     
@@ -24,6 +24,9 @@ class Settings(BaseSettings):
     API_V1_PREFIX: str = "/api/v1"
     PROJECT_NAME: str = "Body Recomp Backend"
     VERSION: str = "0.1.0"
+    # Embed example payloads in the OpenAPI schema; disable in production
+    # to keep them off the model classes entirely
+    OPENAPI_EXAMPLES: bool = True
 
     # CORS Configuration
     ALLOWED_ORIGINS: list[str] = [
@@ -0,0 +1,17 @@
+"""
+Per-request context values for Body Recomp Backend.
+
+Values are stored in ContextVars set once per request by route
+dependencies (see src.api.dependencies.set_request_today), so code running
+inside the request can reuse them instead of recomputing.
+"""
+from contextvars import ContextVar
+from datetime import date
+
+# Calendar date the current request started on; None outside a request
+request_today: ContextVar[date | None] = ContextVar("request_today", default=None)
+
+
+def today() -> date:
+    """Return the current request's date, falling back to date.today()."""
+    return request_today.get() or date.today()
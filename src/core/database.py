@@ -4,6 +4,9 @@ Uses SQLAlchemy 2.0 async for PostgreSQL connections.
 """
 from typing import AsyncGenerator
 
+import orjson
+
+from sqlalchemy import DDL, event, text
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     create_async_engine,
@@ -23,6 +26,14 @@ async_engine = create_async_engine(
     pool_timeout=30,  # Seconds to wait for a connection from the pool
     pool_pre_ping=True,  # Verify connection health before using
     pool_recycle=3600,  # Recycle connections after 1 hour
+    # Reuse the most recently returned connection so a few warm connections
+    # (with their prepared statements) serve most requests, and surplus
+    # ones sit idle long enough to be recycled under low load
+    pool_use_lifo=True,
+    # asyncpg prepared statements kept per connection (default 100)
+    connect_args={"prepared_statement_cache_size": 1024},
+    # Decode JSONB columns (plan_details, meal_timing) with orjson
+    json_deserializer=orjson.loads,
 )
 
 # Create async session maker
@@ -37,6 +48,23 @@ async_session_maker = async_sessionmaker(
 # Create declarative base for models
 Base = declarative_base()
 
+# Timestamp columns are naive UTC, so server-side defaults must not depend
+# on the session TimeZone setting
+UTC_NOW = text("timezone('utc', now())")
+
+# updated_at is maintained by a BEFORE UPDATE trigger rather than an ORM
+# onupdate callback, so bulk and raw SQL updates keep it current as well
+SET_UPDATED_AT_FUNCTION = DDL(
+    "CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$ "
+    "BEGIN NEW.updated_at := timezone('utc', now()); RETURN NEW; END "
+    "$$ LANGUAGE plpgsql"
+)
+SET_UPDATED_AT_TRIGGER = DDL(
+    "CREATE TRIGGER %(table)s_set_updated_at BEFORE UPDATE ON %(table)s "
+    "FOR EACH ROW EXECUTE FUNCTION set_updated_at()"
+)
+event.listen(Base.metadata, "before_create", SET_UPDATED_AT_FUNCTION)
+
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
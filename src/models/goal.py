@@ -9,16 +9,19 @@ from typing import Optional, TYPE_CHECKING
 from sqlalchemy import (
     Enum as SQLEnum,
     DateTime,
+    FetchedValue,
     Numeric,
     CheckConstraint,
+    event,
     ForeignKey,
     Integer,
     Index,
+    text,
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from src.core.database import Base
+from src.core.database import Base, SET_UPDATED_AT_TRIGGER, UTC_NOW
 from src.models.enums import GoalType, GoalStatus
 
 if TYPE_CHECKING:
@@ -37,6 +40,7 @@ class Goal(Base):
     """
 
     __tablename__ = "goals"
+    __mapper_args__ = {"eager_defaults": True}
 
     # Primary Key
     id: Mapped[uuid.UUID] = mapped_column(
@@ -122,6 +126,19 @@ class Goal(Base):
         nullable=False,
     )
 
+    # Energy expenditure the targets were derived from, stored so calorie
+    # aggregates don't need the user and measurement rows (NULL for goals
+    # created before these columns existed)
+    bmr_at_creation: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        nullable=True,
+    )
+
+    tdee_at_creation: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        nullable=True,
+    )
+
     # Estimation
     estimated_weeks_to_goal: Mapped[Optional[int]] = mapped_column(
         Integer,
@@ -151,8 +168,8 @@ class Goal(Base):
 
     updated_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+        server_default=UTC_NOW,
+        server_onupdate=FetchedValue(),
         nullable=False,
     )
 
@@ -191,7 +208,12 @@ class Goal(Base):
 
     # Composite Indexes
     __table_args__ = (
-        Index("ix_goals_user_status", "user_id", "status"),
+        # Partial index: only active goals (at most one per user, FR-018)
+        Index(
+            "ix_goals_user_active",
+            "user_id",
+            postgresql_where=text("status = 'ACTIVE'"),
+        ),
         Index("ix_goals_user_started", "user_id", "started_at"),
     )
 
@@ -269,3 +291,6 @@ class Goal(Base):
         
         # Allow 10% variance
         return actual_progress >= (expected_progress * 0.9)
+
+
+event.listen(Goal.__table__, "after_create", SET_UPDATED_AT_TRIGGER)
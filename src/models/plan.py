@@ -5,16 +5,19 @@ from uuid import uuid4
 from sqlalchemy import (
     CheckConstraint,
     Column,
+    Computed,
     DateTime,
+    FetchedValue,
     ForeignKey,
     Integer,
     String,
     Text,
+    event,
 )
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
 
-from src.core.database import Base
+from src.core.database import SET_UPDATED_AT_TRIGGER, UTC_NOW, Base
 
 
 class TrainingPlan(Base):
@@ -24,6 +27,8 @@ class TrainingPlan(Base):
         id: Unique identifier
         goal_id: Associated goal (one-to-one)
         plan_details: JSONB structured training recommendations
+        cardio_frequency: Cardio sessions per week, generated from
+            plan_details so it can be filtered with a BTREE index
         workout_frequency: Sessions per week
         primary_focus: e.g., "Strength training + cardio for fat loss"
         notes: Additional guidance
@@ -32,6 +37,7 @@ class TrainingPlan(Base):
     """
 
     __tablename__ = "training_plans"
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     goal_id = Column(
@@ -41,6 +47,14 @@ class TrainingPlan(Base):
         unique=True,
     )
     plan_details = Column(JSONB, nullable=False)
+    cardio_frequency = Column(
+        Integer,
+        Computed(
+            "(plan_details #>> '{cardio,frequency}')::int", persisted=True
+        ),
+        nullable=True,
+        index=True,
+    )
     workout_frequency = Column(
         Integer,
         nullable=False,
@@ -52,8 +66,8 @@ class TrainingPlan(Base):
     updated_at = Column(
         DateTime,
         nullable=False,
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+        server_default=UTC_NOW,
+        server_onupdate=FetchedValue(),
     )
 
     # Relationships
@@ -93,6 +107,7 @@ class DietPlan(Base):
     """
 
     __tablename__ = "diet_plans"
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     goal_id = Column(
@@ -127,8 +142,8 @@ class DietPlan(Base):
     updated_at = Column(
         DateTime,
         nullable=False,
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+        server_default=UTC_NOW,
+        server_onupdate=FetchedValue(),
     )
 
     # Relationships
@@ -161,3 +176,7 @@ class DietPlan(Base):
             f"goal_id={self.goal_id}, "
             f"calories={self.daily_calorie_target})>"
         )
+
+
+event.listen(TrainingPlan.__table__, "after_create", SET_UPDATED_AT_TRIGGER)
+event.listen(DietPlan.__table__, "after_create", SET_UPDATED_AT_TRIGGER)
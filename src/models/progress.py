@@ -12,6 +12,7 @@ from sqlalchemy import (
     CheckConstraint,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     Numeric,
     Text,
@@ -130,6 +131,8 @@ class ProgressEntry(Base):
             "weight_kg >= 30.0 AND weight_kg <= 300.0",
             name="reasonable_weight_range"
         ),
+        # One entry per week of a goal; also serves "week X of goal G"
+        Index("ix_progress_goal_week", "goal_id", "week_number", unique=True),
         {"comment": "Weekly progress entries tracking goal progress over time"}
     )
 
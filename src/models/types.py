@@ -0,0 +1,43 @@
+"""
+Custom SQLAlchemy column types for Body Recomp Backend.
+"""
+from enum import Enum
+from typing import Any, Optional
+
+from sqlalchemy import SmallInteger
+from sqlalchemy.engine import Dialect
+from sqlalchemy.types import TypeDecorator
+
+
+class SmallIntEnum(TypeDecorator):
+    """
+    Store a Python enum as a SMALLINT code instead of a native PG enum.
+
+    Codes are the member's position in the enum declaration, so new
+    members must only ever be appended to the enum class.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, enum_class: type[Enum]) -> None:
+        super().__init__()
+        self.enum_class = enum_class
+        self._members = tuple(enum_class)
+        self._codes = {member: code for code, member in enumerate(self._members)}
+
+    def process_bind_param(
+        self, value: Optional[Any], dialect: Dialect
+    ) -> Optional[int]:
+        """Convert an enum member (or its value) to its integer code."""
+        if value is None:
+            return None
+        return self._codes[self.enum_class(value)]
+
+    def process_result_value(
+        self, value: Optional[int], dialect: Dialect
+    ) -> Optional[Enum]:
+        """Convert a stored integer code back to its enum member."""
+        if value is None:
+            return None
+        return self._members[value]
@@ -7,17 +7,21 @@ from decimal import Decimal
 from typing import TYPE_CHECKING
 
 from sqlalchemy import (
-    String,
-    Enum as SQLEnum,
+    Text,
     DateTime,
+    FetchedValue,
     Numeric,
     CheckConstraint,
+    event,
+    Index,
+    func,
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from src.core.database import Base
+from src.core.database import Base, SET_UPDATED_AT_TRIGGER, UTC_NOW
 from src.models.enums import Gender, CalculationMethod, ActivityLevel
+from src.models.types import SmallIntEnum
 
 if TYPE_CHECKING:
     from src.models.measurement import BodyMeasurement
@@ -28,6 +32,7 @@ class User(Base):
     """User model representing a registered user in the system."""
 
     __tablename__ = "users"
+    __mapper_args__ = {"eager_defaults": True}
 
     # Primary Key
     id: Mapped[uuid.UUID] = mapped_column(
@@ -37,19 +42,16 @@ class User(Base):
     )
 
     # Authentication
-    email: Mapped[str] = mapped_column(
-        String(255),
-        unique=True,
-        nullable=False,
-        index=True,
-    )
-    hashed_password: Mapped[str] = mapped_column(String(255), nullable=False)
+    # Uniqueness is case-insensitive, see uq_users_email_lower below
+    email: Mapped[str] = mapped_column(Text, nullable=False)
+    hashed_password: Mapped[str] = mapped_column(Text, nullable=False)
 
     # Personal Information
-    full_name: Mapped[str] = mapped_column(String(255), nullable=False)
+    full_name: Mapped[str] = mapped_column(Text, nullable=False)
     date_of_birth: Mapped[datetime] = mapped_column(DateTime, nullable=False)
     gender: Mapped[Gender] = mapped_column(
-        SQLEnum(Gender, values_callable=lambda x: [e.value for e in x]),
+        SmallIntEnum(Gender),
+        CheckConstraint("gender IN (0, 1)"),
         nullable=False,
     )
 
@@ -62,11 +64,13 @@ class User(Base):
 
     # Preferences
     preferred_calculation_method: Mapped[CalculationMethod] = mapped_column(
-        SQLEnum(CalculationMethod, values_callable=lambda x: [e.value for e in x]),
+        SmallIntEnum(CalculationMethod),
+        CheckConstraint("preferred_calculation_method IN (0, 1, 2)"),
         nullable=False,
     )
     activity_level: Mapped[ActivityLevel] = mapped_column(
-        SQLEnum(ActivityLevel, values_callable=lambda x: [e.value for e in x]),
+        SmallIntEnum(ActivityLevel),
+        CheckConstraint("activity_level IN (0, 1, 2, 3, 4)"),
         nullable=False,
     )
 
@@ -79,8 +83,8 @@ class User(Base):
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+        server_default=UTC_NOW,
+        server_onupdate=FetchedValue(),
         nullable=False,
     )
 
@@ -99,3 +103,11 @@ class User(Base):
 
     def __repr__(self) -> str:
         return f"<User(id={self.id}, email={self.email})>"
+
+
+# Functional unique index so case-insensitive lookups on lower(email)
+# (login, registration) are index seeks
+Index("uq_users_email_lower", func.lower(User.email), unique=True)
+
+
+event.listen(User.__table__, "after_create", SET_UPDATED_AT_TRIGGER)
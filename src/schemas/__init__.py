@@ -0,0 +1,16 @@
+"""Pydantic schemas for Body Recomp Backend."""
+from typing import Any
+
+from src.core.config import settings
+
+
+def openapi_examples(*examples: dict[str, Any]) -> dict[str, Any] | None:
+    """
+    Build a json_schema_extra value holding OpenAPI examples.
+
+    Returns None when OPENAPI_EXAMPLES is disabled, so the example dicts
+    are not retained on the model class or copied into its schema.
+    """
+    if not settings.OPENAPI_EXAMPLES:
+        return None
+    return {"examples": list(examples)}
@@ -14,6 +14,40 @@ from pydantic import (
 
 from src.models.enums import CalculationMethod
 
+# Field combinations accepted per calculation method. A measurement is valid
+# when every field of at least one combination is provided.
+_METHOD_REQUIRED: dict[CalculationMethod, tuple[tuple[str, ...], ...]] = {
+    CalculationMethod.NAVY: (("waist_cm", "neck_cm"),),
+    CalculationMethod.THREE_SITE: (
+        ("chest_mm", "abdomen_mm", "thigh_mm"),  # men
+        ("tricep_mm", "suprailiac_mm", "thigh_mm"),  # women
+    ),
+    CalculationMethod.SEVEN_SITE: (
+        (
+            "chest_mm",
+            "midaxillary_mm",
+            "tricep_mm",
+            "subscapular_mm",
+            "abdomen_mm",
+            "suprailiac_mm",
+            "thigh_mm",
+        ),
+    ),
+}
+
+_METHOD_ERRORS: dict[CalculationMethod, str] = {
+    CalculationMethod.NAVY: "{first} is required for Navy method",
+    CalculationMethod.THREE_SITE: (
+        "3-Site method requires either "
+        "(chest_mm, abdomen_mm, thigh_mm) for males or "
+        "(tricep_mm, suprailiac_mm, thigh_mm) for females"
+    ),
+    CalculationMethod.SEVEN_SITE: (
+        "7-Site method requires all skinfold measurements. "
+        "Missing: {missing}"
+    ),
+}
+
 
 class BodyMeasurementCreate(BaseModel):
     """
@@ -112,63 +146,25 @@ class BodyMeasurementCreate(BaseModel):
         Validate required fields based on calculation method and gender.
         
         Implements FR-006-B: Only require fields for selected method.
+        Navy hip_cm is required for women, but gender is not part of this
+        schema, so that check is done in the service layer.
         """
         method = self.calculation_method
-        
-        if method == CalculationMethod.NAVY:
-            # Navy requires waist and neck
-            if not self.waist_cm:
-                raise ValueError("waist_cm is required for Navy method")
-            if not self.neck_cm:
-                raise ValueError("neck_cm is required for Navy method")
-            # Hip is required for women, but we don't have gender
-            # in this schema. Validation done in service layer.
-        
-        elif method == CalculationMethod.THREE_SITE:
-            # 3-Site requires chest/abdomen/thigh (men)
-            # or tricep/suprailiac/thigh (women)
-            # We check for at least one valid combination
-            male_combo = (
-                self.chest_mm is not None
-                and self.abdomen_mm is not None
-                and self.thigh_mm is not None
-            )
-            female_combo = (
-                self.tricep_mm is not None
-                and self.suprailiac_mm is not None
-                and self.thigh_mm is not None
+        combos = _METHOD_REQUIRED.get(method)
+        if combos is None:
+            return self
+
+        for combo in combos:
+            if all(getattr(self, name) is not None for name in combo):
+                return self
+
+        missing = [name for name in combos[0] if getattr(self, name) is None]
+        raise ValueError(
+            _METHOD_ERRORS[method].format(
+                first=missing[0] if missing else "",
+                missing=", ".join(missing),
             )
-            
-            if not (male_combo or female_combo):
-                raise ValueError(
-                    "3-Site method requires either "
-                    "(chest_mm, abdomen_mm, thigh_mm) for males or "
-                    "(tricep_mm, suprailiac_mm, thigh_mm) for females"
-                )
-        
-        elif method == CalculationMethod.SEVEN_SITE:
-            # 7-Site requires all seven skinfold measurements
-            required_fields = [
-                ("chest_mm", self.chest_mm),
-                ("midaxillary_mm", self.midaxillary_mm),
-                ("tricep_mm", self.tricep_mm),
-                ("subscapular_mm", self.subscapular_mm),
-                ("abdomen_mm", self.abdomen_mm),
-                ("suprailiac_mm", self.suprailiac_mm),
-                ("thigh_mm", self.thigh_mm),
-            ]
-            
-            missing = [
-                name for name, value in required_fields if value is None
-            ]
-            
-            if missing:
-                raise ValueError(
-                    f"7-Site method requires all skinfold measurements. "
-                    f"Missing: {', '.join(missing)}"
-                )
-        
-        return self
+        )
 
 
 class BodyMeasurementResponse(BaseModel):
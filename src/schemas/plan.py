@@ -3,7 +3,9 @@ from datetime import datetime
 from typing import Any, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from src.schemas import openapi_examples
 
 
 class TrainingPlanResponse(BaseModel):
@@ -31,43 +33,41 @@ class TrainingPlanResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    model_config = {
-        "from_attributes": True,
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "id": "123e4567-e89b-12d3-a456-426614174000",
-                    "goal_id": "223e4567-e89b-12d3-a456-426614174000",
-                    "workout_frequency": 5,
-                    "primary_focus": "Strength training + cardio for fat loss",
-                    "plan_details": {
-                        "strength_training": {
-                            "frequency": 3,
-                            "exercises": [
-                                {
-                                    "name": "Compound lifts",
-                                    "sets": "3-4",
-                                    "reps": "6-12",
-                                    "rest": "2-3 minutes",
-                                }
-                            ],
-                            "progression": "Maintain strength during deficit",
-                        },
-                        "cardio": {
-                            "frequency": 2,
-                            "type": "LISS or HIIT",
-                            "duration": "20-30 minutes",
-                            "intensity": "Zone 2 for fat burning",
-                        },
-                        "rest_days": 2,
+    model_config = ConfigDict(
+        from_attributes=True,
+        json_schema_extra=openapi_examples(
+            {
+                "id": "123e4567-e89b-12d3-a456-426614174000",
+                "goal_id": "223e4567-e89b-12d3-a456-426614174000",
+                "workout_frequency": 5,
+                "primary_focus": "Strength training + cardio for fat loss",
+                "plan_details": {
+                    "strength_training": {
+                        "frequency": 3,
+                        "exercises": [
+                            {
+                                "name": "Compound lifts",
+                                "sets": "3-4",
+                                "reps": "6-12",
+                                "rest": "2-3 minutes",
+                            }
+                        ],
+                        "progression": "Maintain strength during deficit",
+                    },
+                    "cardio": {
+                        "frequency": 2,
+                        "type": "LISS or HIIT",
+                        "duration": "20-30 minutes",
+                        "intensity": "Zone 2 for fat burning",
                     },
-                    "notes": "Prioritize recovery during deficit",
-                    "created_at": "2025-10-27T10:00:00Z",
-                    "updated_at": "2025-10-27T10:00:00Z",
-                }
-            ]
-        },
-    }
+                    "rest_days": 2,
+                },
+                "notes": "Prioritize recovery during deficit",
+                "created_at": "2025-10-27T10:00:00Z",
+                "updated_at": "2025-10-27T10:00:00Z",
+            }
+        ),
+    )
 
 
 class DietPlanResponse(BaseModel):
@@ -99,32 +99,30 @@ class DietPlanResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    model_config = {
-        "from_attributes": True,
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "id": "323e4567-e89b-12d3-a456-426614174000",
-                    "goal_id": "223e4567-e89b-12d3-a456-426614174000",
-                    "daily_calorie_target": 2200,
-                    "protein_grams": 198,
-                    "carbs_grams": 220,
-                    "fat_grams": 61,
-                    "meal_timing": {
-                        "meals_per_day": 3,
-                        "pre_workout": "30-60 min before: 40g carbs",
-                        "post_workout": "Within 2h: 40g protein, 80g carbs",
-                    },
-                    "guidelines": (
-                        "High protein (2.2g/kg) to preserve muscle. "
-                        "Moderate carbs for training. Healthy fats."
-                    ),
-                    "created_at": "2025-10-27T10:00:00Z",
-                    "updated_at": "2025-10-27T10:00:00Z",
-                }
-            ]
-        },
-    }
+    model_config = ConfigDict(
+        from_attributes=True,
+        json_schema_extra=openapi_examples(
+            {
+                "id": "323e4567-e89b-12d3-a456-426614174000",
+                "goal_id": "223e4567-e89b-12d3-a456-426614174000",
+                "daily_calorie_target": 2200,
+                "protein_grams": 198,
+                "carbs_grams": 220,
+                "fat_grams": 61,
+                "meal_timing": {
+                    "meals_per_day": 3,
+                    "pre_workout": "30-60 min before: 40g carbs",
+                    "post_workout": "Within 2h: 40g protein, 80g carbs",
+                },
+                "guidelines": (
+                    "High protein (2.2g/kg) to preserve muscle. "
+                    "Moderate carbs for training. Healthy fats."
+                ),
+                "created_at": "2025-10-27T10:00:00Z",
+                "updated_at": "2025-10-27T10:00:00Z",
+            }
+        ),
+    )
 
 
 class MacronutrientBreakdown(BaseModel):
@@ -154,21 +152,19 @@ class MacronutrientBreakdown(BaseModel):
     fat_percentage: float = Field(..., ge=0, le=100)
     total_calories: int
 
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "protein_grams": 198,
-                    "protein_calories": 792,
-                    "protein_percentage": 36.0,
-                    "carbs_grams": 220,
-                    "carbs_calories": 880,
-                    "carbs_percentage": 40.0,
-                    "fat_grams": 61,
-                    "fat_calories": 549,
-                    "fat_percentage": 24.0,
-                    "total_calories": 2221,
-                }
-            ]
-        }
-    }
+    model_config = ConfigDict(
+        json_schema_extra=openapi_examples(
+            {
+                "protein_grams": 198,
+                "protein_calories": 792,
+                "protein_percentage": 36.0,
+                "carbs_grams": 220,
+                "carbs_calories": 880,
+                "carbs_percentage": 40.0,
+                "fat_grams": 61,
+                "fat_calories": 549,
+                "fat_percentage": 24.0,
+                "total_calories": 2221,
+            }
+        ),
+    )
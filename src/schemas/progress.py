@@ -1,9 +1,14 @@
 """Progress tracking Pydantic schemas for Body Recomp Backend."""
 from datetime import datetime
-from typing import Optional
+from typing import Any, Literal, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field
+
+from src.schemas import openapi_examples
+
+# Checked by pydantic-core directly, no Python validator callback
+Trend = Literal["improving", "plateau", "worsening", "insufficient_data"]
 
 
 class ProgressEntryCreate(BaseModel):
@@ -24,16 +29,14 @@ class ProgressEntryCreate(BaseModel):
         description="Optional notes about this week's progress"
     )
 
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "measurement_id": "123e4567-e89b-12d3-a456-426614174000",
-                    "notes": "Week 1: Good progress, diet compliance high"
-                }
-            ]
-        }
-    }
+    model_config = ConfigDict(
+        json_schema_extra=openapi_examples(
+            {
+                "measurement_id": "123e4567-e89b-12d3-a456-426614174000",
+                "notes": "Week 1: Good progress, diet compliance high"
+            }
+        ),
+    )
 
 
 class ProgressEntryResponse(BaseModel):
@@ -58,9 +61,11 @@ class ProgressEntryResponse(BaseModel):
     id: UUID
     goal_id: UUID
     measurement_id: UUID
-    week_number: int = Field(..., gt=0)
-    body_fat_percentage: float = Field(..., ge=3.0, le=60.0)
-    weight_kg: float = Field(..., ge=30.0, le=300.0)
+    # Bounds are enforced by the progress_entries CHECK constraints; rows
+    # served here are already valid, so no per-field range checks
+    week_number: int
+    body_fat_percentage: float
+    weight_kg: float
     body_fat_change: float
     weight_change_kg: float
     is_on_track: bool
@@ -75,26 +80,48 @@ class ProgressEntryResponse(BaseModel):
         description="Warning when body fat gain rate exceeds 0.5%/week"
     )
 
-    model_config = {
-        "from_attributes": True,
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "id": "123e4567-e89b-12d3-a456-426614174000",
-                    "goal_id": "223e4567-e89b-12d3-a456-426614174000",
-                    "measurement_id": "323e4567-e89b-12d3-a456-426614174000",
-                    "week_number": 1,
-                    "body_fat_percentage": 19.5,
-                    "weight_kg": 79.0,
-                    "body_fat_change": -0.5,
-                    "weight_change_kg": -1.0,
-                    "is_on_track": True,
-                    "notes": "Week 1: Good progress",
-                    "logged_at": "2025-10-27T10:00:00Z"
-                }
-            ]
-        }
-    }
+    model_config = ConfigDict(
+        from_attributes=True,
+        json_schema_extra=openapi_examples(
+            {
+                "id": "123e4567-e89b-12d3-a456-426614174000",
+                "goal_id": "223e4567-e89b-12d3-a456-426614174000",
+                "measurement_id": "323e4567-e89b-12d3-a456-426614174000",
+                "week_number": 1,
+                "body_fat_percentage": 19.5,
+                "weight_kg": 79.0,
+                "body_fat_change": -0.5,
+                "weight_change_kg": -1.0,
+                "is_on_track": True,
+                "notes": "Week 1: Good progress",
+                "logged_at": "2025-10-27T10:00:00Z"
+            }
+        ),
+    )
+
+    @classmethod
+    def from_orm_trusted(cls, entry: Any) -> "ProgressEntryResponse":
+        """
+        Build from a ProgressEntry ORM row without running validation.
+
+        Only for rows loaded from our own database; never use this for
+        client-supplied data.
+        """
+        return cls.model_construct(
+            id=entry.id,
+            goal_id=entry.goal_id,
+            measurement_id=entry.measurement_id,
+            week_number=entry.week_number,
+            body_fat_percentage=float(entry.body_fat_percentage),
+            weight_kg=float(entry.weight_kg),
+            body_fat_change=float(entry.body_fat_change),
+            weight_change_kg=float(entry.weight_change_kg),
+            is_on_track=entry.is_on_track,
+            notes=entry.notes,
+            logged_at=entry.logged_at,
+            ceiling_warning=getattr(entry, "ceiling_warning", None),
+            rate_warning=getattr(entry, "rate_warning", None),
+        )
 
 
 class TrendsResponse(BaseModel):
@@ -131,7 +158,7 @@ class TrendsResponse(BaseModel):
         ...,
         description="Average weekly weight change in kg"
     )
-    trend: str = Field(
+    trend: Trend = Field(
         ...,
         description="Overall trend: 'improving', 'plateau', 'worsening', or 'insufficient_data'"
     )
@@ -145,31 +172,18 @@ class TrendsResponse(BaseModel):
         description="Estimated weeks to reach goal based on current progress"
     )
 
-    @field_validator("trend")
-    @classmethod
-    def validate_trend(cls, v: str) -> str:
-        """Validate trend classification."""
-        valid_trends = {"improving", "plateau", "worsening", "insufficient_data"}
-        if v not in valid_trends:
-            raise ValueError(
-                f"trend must be one of {valid_trends}, got '{v}'"
-            )
-        return v
-
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "goal_id": "223e4567-e89b-12d3-a456-426614174000",
-                    "progress_percentage": 25.0,
-                    "weeks_elapsed": 4,
-                    "is_on_track": True,
-                    "weekly_bf_change_avg": -0.5,
-                    "weekly_weight_change_avg": -0.8,
-                    "trend": "improving",
-                    "adjustment_suggestion": "Maintain current plan - excellent progress!",
-                    "estimated_weeks_remaining": 12
-                }
-            ]
-        }
-    }
+    model_config = ConfigDict(
+        json_schema_extra=openapi_examples(
+            {
+                "goal_id": "223e4567-e89b-12d3-a456-426614174000",
+                "progress_percentage": 25.0,
+                "weeks_elapsed": 4,
+                "is_on_track": True,
+                "weekly_bf_change_avg": -0.5,
+                "weekly_weight_change_avg": -0.8,
+                "trend": "improving",
+                "adjustment_suggestion": "Maintain current plan - excellent progress!",
+                "estimated_weeks_remaining": 12
+            }
+        ),
+    )
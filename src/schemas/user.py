@@ -3,12 +3,46 @@ Pydantic schemas for User model.
 """
 from datetime import date, datetime
 from decimal import Decimal
+from functools import lru_cache
+from typing import Any
 from uuid import UUID
 
 from pydantic import BaseModel, EmailStr, Field, field_validator
 
+from src.core import context
 from src.models.enums import Gender, CalculationMethod, ActivityLevel
 
+MIN_AGE_YEARS = 13
+MAX_AGE_YEARS = 120
+
+
+def _years_before(day: date, years: int) -> date:
+    """Same calendar day `years` earlier; Feb 29 maps to Feb 28."""
+    if day.month == 2 and day.day == 29:
+        day = day.replace(day=28)
+    return day.replace(year=day.year - years)
+
+
+@lru_cache(maxsize=1)
+def _dob_bounds(today: date) -> tuple[date, date]:
+    """
+    Exclusive lower / inclusive upper date_of_birth bounds for `today`.
+
+    Cached on the date, so the bounds are only rebuilt once per day.
+    """
+    return (
+        _years_before(today, MAX_AGE_YEARS + 1),
+        _years_before(today, MIN_AGE_YEARS),
+    )
+
+
+def _validate_age(v: date) -> date:
+    """Validate a date of birth puts the user between 13 and 120 years old."""
+    oldest_excluded, youngest_allowed = _dob_bounds(context.today())
+    if not oldest_excluded < v <= youngest_allowed:
+        raise ValueError("Age must be between 13 and 120 years")
+    return v
+
 
 class UserCreate(BaseModel):
     """Schema for creating a new user."""
@@ -26,11 +60,7 @@ class UserCreate(BaseModel):
     @classmethod
     def validate_age(cls, v: date) -> date:
         """Validate user is between 13 and 120 years old."""
-        today = date.today()
-        age = today.year - v.year - ((today.month, today.day) < (v.month, v.day))
-        if age < 13 or age > 120:
-            raise ValueError("Age must be between 13 and 120 years")
-        return v
+        return _validate_age(v)
 
 
 class UserUpdate(BaseModel):
@@ -49,11 +79,7 @@ class UserUpdate(BaseModel):
         """Validate user is between 13 and 120 years old."""
         if v is None:
             return v
-        today = date.today()
-        age = today.year - v.year - ((today.month, today.day) < (v.month, v.day))
-        if age < 13 or age > 120:
-            raise ValueError("Age must be between 13 and 120 years")
-        return v
+        return _validate_age(v)
 
 
 class UserResponse(BaseModel):
@@ -72,10 +98,41 @@ class UserResponse(BaseModel):
 
     model_config = {"from_attributes": True}
 
-
-class UserInDB(UserResponse):
-    """Schema for user in database (includes hashed password)."""
-
-    hashed_password: str
-
-    model_config = {"from_attributes": True}
+    @classmethod
+    def from_orm_trusted(cls, user: Any) -> "UserResponse":
+        """
+        Build from a User ORM row without running validation.
+
+        Only for rows loaded from our own database; never use this for
+        client-supplied data.
+        """
+        date_of_birth = user.date_of_birth
+        if isinstance(date_of_birth, datetime):
+            # Stored as a DateTime column; the API exposes a plain date
+            date_of_birth = date_of_birth.date()
+        return cls.model_construct(
+            id=user.id,
+            email=user.email,
+            full_name=user.full_name,
+            date_of_birth=date_of_birth,
+            gender=user.gender,
+            height_cm=float(user.height_cm),
+            preferred_calculation_method=user.preferred_calculation_method,
+            activity_level=user.activity_level,
+            created_at=user.created_at,
+            updated_at=user.updated_at,
+        )
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Resolve UserInDB lazily (PEP 562).
+
+    It lives in src.schemas.user_internal so its pydantic schema is only
+    built by code that actually needs hashed passwords.
+    """
+    if name == "UserInDB":
+        from src.schemas.user_internal import UserInDB
+
+        return UserInDB
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,24 @@
+"""
+Internal user schemas that carry credentials.
+
+Kept out of src.schemas.user so the schema is only built when needed;
+never use these as API response models.
+"""
+from typing import Any
+
+from src.schemas.user import UserResponse
+
+
+class UserInDB(UserResponse):
+    """Schema for user in database (includes hashed password)."""
+
+    hashed_password: str
+
+    model_config = {"from_attributes": True}
+
+    @classmethod
+    def from_orm_trusted(cls, user: Any) -> "UserInDB":
+        """Build from a User ORM row without running validation."""
+        instance = super().from_orm_trusted(user)
+        instance.hashed_password = user.hashed_password
+        return instance
@@ -4,20 +4,143 @@ Formulas based on research.md specifications.
 """
 import math
 from decimal import Decimal
+from typing import Callable, Mapping
 
 from src.models.enums import Gender, CalculationMethod
 
 
+def _finalize(body_fat: float) -> Decimal:
+    """Quantize a float body fat result to a 2-decimal Decimal."""
+    return Decimal(f"{body_fat:.2f}")
+
+
+# Pure float formula kernels. They take and return plain floats with no
+# Decimal/enum handling so the arithmetic stays a handful of FLOPs.
+
+
+def _navy_male(waist: float, neck: float, height: float) -> float:
+    """Navy: 86.010 × log10(waist - neck) - 70.041 × log10(height) + 36.76"""
+    return 86.010 * math.log10(waist - neck) - 70.041 * math.log10(height) + 36.76
+
+
+def _navy_female(waist: float, hip: float, neck: float, height: float) -> float:
+    """Navy: 163.205 × log10(waist + hip - neck) - 97.684 × log10(height) - 78.387"""
+    return (
+        163.205 * math.log10(waist + hip - neck)
+        - 97.684 * math.log10(height)
+        - 78.387
+    )
+
+
+def _jp3_male(sum_skinfolds: float, age: float) -> float:
+    """JP3 men: density = 1.10938 - 0.0008267(sum) + 0.0000016(sum^2) - 0.0002574(age)"""
+    # Horner form of the density polynomial with Siri (495 / density - 450) inlined
+    return 495.0 / (
+        sum_skinfolds * (0.0000016 * sum_skinfolds - 0.0008267)
+        + 1.10938
+        - 0.0002574 * age
+    ) - 450.0
+
+
+def _jp3_female(sum_skinfolds: float, age: float) -> float:
+    """JP3 women: density = 1.0994921 - 0.0009929(sum) + 0.0000023(sum^2) - 0.0001392(age)"""
+    return 495.0 / (
+        sum_skinfolds * (0.0000023 * sum_skinfolds - 0.0009929)
+        + 1.0994921
+        - 0.0001392 * age
+    ) - 450.0
+
+
+def _jp7_male(sum_skinfolds: float, age: float) -> float:
+    """JP7 men: density = 1.112 - 0.00043499(sum) + 0.00000055(sum^2) - 0.00028826(age)"""
+    return 495.0 / (
+        sum_skinfolds * (0.00000055 * sum_skinfolds - 0.00043499)
+        + 1.112
+        - 0.00028826 * age
+    ) - 450.0
+
+
+def _jp7_female(sum_skinfolds: float, age: float) -> float:
+    """JP7 women: density = 1.097 - 0.00046971(sum) + 0.00000056(sum^2) - 0.00012828(age)"""
+    return 495.0 / (
+        sum_skinfolds * (0.00000056 * sum_skinfolds - 0.00046971)
+        + 1.097
+        - 0.00012828 * age
+    ) - 450.0
+
+
+# Specialized entry points, one per (method, gender) pair, so dispatch is a
+# single dict lookup and each function reads only the measurements its
+# formula needs. These hold the only copy of the required-measurement
+# checks; the public calculate_* methods delegate here.
+
+Measurements = Mapping[str, float | None]
+
+
+def _calc_navy_male(age: int, height_cm: float, m: Measurements) -> float:
+    return _navy_male(m["waist_cm"], m["neck_cm"], height_cm)
+
+
+def _calc_navy_female(age: int, height_cm: float, m: Measurements) -> float:
+    hip_cm = m.get("hip_cm")
+    if hip_cm is None:
+        raise ValueError("Hip measurement required for women using Navy method")
+    return _navy_female(m["waist_cm"], hip_cm, m["neck_cm"], height_cm)
+
+
+def _calc_3_site_male(age: int, height_cm: float, m: Measurements) -> float:
+    chest_mm, abdomen_mm, thigh_mm = m.get("chest_mm"), m.get("abdomen_mm"), m.get("thigh_mm")
+    if chest_mm is None or abdomen_mm is None or thigh_mm is None:
+        raise ValueError("Chest, abdomen, and thigh measurements required for men")
+    return _jp3_male(chest_mm + abdomen_mm + thigh_mm, age)
+
+
+def _calc_3_site_female(age: int, height_cm: float, m: Measurements) -> float:
+    tricep_mm, suprailiac_mm, thigh_mm = (
+        m.get("tricep_mm"), m.get("suprailiac_mm"), m.get("thigh_mm")
+    )
+    if tricep_mm is None or suprailiac_mm is None or thigh_mm is None:
+        raise ValueError("Tricep, suprailiac, and thigh measurements required for women")
+    return _jp3_female(tricep_mm + suprailiac_mm + thigh_mm, age)
+
+
+def _seven_site_sum(m: Measurements) -> float:
+    return (
+        m["chest_mm"] + m["midaxillary_mm"] + m["tricep_mm"] + m["subscapular_mm"]
+        + m["abdomen_mm"] + m["suprailiac_mm"] + m["thigh_mm"]
+    )
+
+
+def _calc_7_site_male(age: int, height_cm: float, m: Measurements) -> float:
+    return _jp7_male(_seven_site_sum(m), age)
+
+
+def _calc_7_site_female(age: int, height_cm: float, m: Measurements) -> float:
+    return _jp7_female(_seven_site_sum(m), age)
+
+
+_DISPATCH: dict[
+    tuple[CalculationMethod, Gender], Callable[[int, float, Measurements], float]
+] = {
+    (CalculationMethod.NAVY, Gender.MALE): _calc_navy_male,
+    (CalculationMethod.NAVY, Gender.FEMALE): _calc_navy_female,
+    (CalculationMethod.THREE_SITE, Gender.MALE): _calc_3_site_male,
+    (CalculationMethod.THREE_SITE, Gender.FEMALE): _calc_3_site_female,
+    (CalculationMethod.SEVEN_SITE, Gender.MALE): _calc_7_site_male,
+    (CalculationMethod.SEVEN_SITE, Gender.FEMALE): _calc_7_site_female,
+}
+
+
 class BodyFatCalculator:
     """Service for calculating body fat percentage using various methods."""
 
     @staticmethod
     def calculate_navy(
         gender: Gender,
-        height_cm: Decimal,
-        waist_cm: Decimal,
-        neck_cm: Decimal,
-        hip_cm: Decimal | None = None,
+        height_cm: float,
+        waist_cm: float,
+        neck_cm: float,
+        hip_cm: float | None = None,
     ) -> Decimal:
         """
         Calculate body fat percentage using US Navy method.
@@ -38,34 +161,21 @@ class BodyFatCalculator:
         Raises:
             ValueError: If required measurements are missing or invalid
         """
-        if gender == Gender.MALE:
-            # Men: BF% = 86.010 × log10(waist - neck) - 70.041 × log10(height) + 36.76
-            body_fat = (
-                86.010 * math.log10(float(waist_cm - neck_cm))
-                - 70.041 * math.log10(float(height_cm))
-                + 36.76
-            )
-        else:  # Female
-            if hip_cm is None:
-                raise ValueError("Hip measurement required for women using Navy method")
-            # Women: BF% = 163.205 × log10(waist + hip - neck) - 97.684 × log10(height) - 78.387
-            body_fat = (
-                163.205 * math.log10(float(waist_cm + hip_cm - neck_cm))
-                - 97.684 * math.log10(float(height_cm))
-                - 78.387
-            )
+        measurements = {"waist_cm": waist_cm, "neck_cm": neck_cm, "hip_cm": hip_cm}
+        # Navy formulas don't use age
+        body_fat = _DISPATCH[(CalculationMethod.NAVY, gender)](0, height_cm, measurements)
 
-        return Decimal(str(round(body_fat, 2)))
+        return _finalize(body_fat)
 
     @staticmethod
     def calculate_3_site(
         gender: Gender,
         age: int,
-        chest_mm: Decimal | None = None,
-        abdomen_mm: Decimal | None = None,
-        thigh_mm: Decimal | None = None,
-        tricep_mm: Decimal | None = None,
-        suprailiac_mm: Decimal | None = None,
+        chest_mm: float | None = None,
+        abdomen_mm: float | None = None,
+        thigh_mm: float | None = None,
+        tricep_mm: float | None = None,
+        suprailiac_mm: float | None = None,
     ) -> Decimal:
         """
         Calculate body fat percentage using 3-Site Skinfold method.
@@ -92,44 +202,29 @@ class BodyFatCalculator:
         Raises:
             ValueError: If required measurements are missing
         """
-        if gender == Gender.MALE:
-            if chest_mm is None or abdomen_mm is None or thigh_mm is None:
-                raise ValueError("Chest, abdomen, and thigh measurements required for men")
-            sum_skinfolds = float(chest_mm + abdomen_mm + thigh_mm)
-            # Men: density = 1.10938 - 0.0008267(sum) + 0.0000016(sum^2) - 0.0002574(age)
-            density = (
-                1.10938
-                - 0.0008267 * sum_skinfolds
-                + 0.0000016 * (sum_skinfolds ** 2)
-                - 0.0002574 * age
-            )
-        else:  # Female
-            if tricep_mm is None or suprailiac_mm is None or thigh_mm is None:
-                raise ValueError("Tricep, suprailiac, and thigh measurements required for women")
-            sum_skinfolds = float(tricep_mm + suprailiac_mm + thigh_mm)
-            # Women: density = 1.0994921 - 0.0009929(sum) + 0.0000023(sum^2) - 0.0001392(age)
-            density = (
-                1.0994921
-                - 0.0009929 * sum_skinfolds
-                + 0.0000023 * (sum_skinfolds ** 2)
-                - 0.0001392 * age
-            )
+        measurements = {
+            "chest_mm": chest_mm,
+            "abdomen_mm": abdomen_mm,
+            "thigh_mm": thigh_mm,
+            "tricep_mm": tricep_mm,
+            "suprailiac_mm": suprailiac_mm,
+        }
+        # Skinfold formulas don't use height
+        body_fat = _DISPATCH[(CalculationMethod.THREE_SITE, gender)](age, 0.0, measurements)
 
-        # Siri equation: BF% = (495 / density) - 450
-        body_fat = (495 / density) - 450
-        return Decimal(str(round(body_fat, 2)))
+        return _finalize(body_fat)
 
     @staticmethod
     def calculate_7_site(
         gender: Gender,
         age: int,
-        chest_mm: Decimal,
-        midaxillary_mm: Decimal,
-        tricep_mm: Decimal,
-        subscapular_mm: Decimal,
-        abdomen_mm: Decimal,
-        suprailiac_mm: Decimal,
-        thigh_mm: Decimal,
+        chest_mm: float,
+        midaxillary_mm: float,
+        tricep_mm: float,
+        subscapular_mm: float,
+        abdomen_mm: float,
+        suprailiac_mm: float,
+        thigh_mm: float,
     ) -> Decimal:
         """
         Calculate body fat percentage using 7-Site Skinfold method.
@@ -150,31 +245,18 @@ class BodyFatCalculator:
         Returns:
             Body fat percentage as Decimal
         """
-        sum_skinfolds = float(
-            chest_mm + midaxillary_mm + tricep_mm + subscapular_mm
-            + abdomen_mm + suprailiac_mm + thigh_mm
-        )
-
-        if gender == Gender.MALE:
-            # Men: density = 1.112 - 0.00043499(sum) + 0.00000055(sum^2) - 0.00028826(age)
-            density = (
-                1.112
-                - 0.00043499 * sum_skinfolds
-                + 0.00000055 * (sum_skinfolds ** 2)
-                - 0.00028826 * age
-            )
-        else:  # Female
-            # Women: density = 1.097 - 0.00046971(sum) + 0.00000056(sum^2) - 0.00012828(age)
-            density = (
-                1.097
-                - 0.00046971 * sum_skinfolds
-                + 0.00000056 * (sum_skinfolds ** 2)
-                - 0.00012828 * age
-            )
+        measurements = {
+            "chest_mm": chest_mm,
+            "midaxillary_mm": midaxillary_mm,
+            "tricep_mm": tricep_mm,
+            "subscapular_mm": subscapular_mm,
+            "abdomen_mm": abdomen_mm,
+            "suprailiac_mm": suprailiac_mm,
+            "thigh_mm": thigh_mm,
+        }
+        body_fat = _DISPATCH[(CalculationMethod.SEVEN_SITE, gender)](age, 0.0, measurements)
 
-        # Siri equation: BF% = (495 / density) - 450
-        body_fat = (495 / density) - 450
-        return Decimal(str(round(body_fat, 2)))
+        return _finalize(body_fat)
 
     @classmethod
     def calculate(
@@ -182,8 +264,8 @@ class BodyFatCalculator:
         method: CalculationMethod,
         gender: Gender,
         age: int,
-        height_cm: Decimal,
-        **measurements: Decimal | None,
+        height_cm: float,
+        **measurements: float | None,
     ) -> Decimal:
         """
         Calculate body fat percentage using the specified method.
@@ -201,38 +283,10 @@ class BodyFatCalculator:
         Raises:
             ValueError: If method is invalid or required measurements are missing
         """
-        if method == CalculationMethod.NAVY:
-            result = cls.calculate_navy(
-                gender=gender,
-                height_cm=height_cm,
-                waist_cm=measurements.get("waist_cm"),
-                neck_cm=measurements.get("neck_cm"),
-                hip_cm=measurements.get("hip_cm"),
-            )
-        elif method == CalculationMethod.THREE_SITE:
-            result = cls.calculate_3_site(
-                gender=gender,
-                age=age,
-                chest_mm=measurements.get("chest_mm"),
-                abdomen_mm=measurements.get("abdomen_mm"),
-                thigh_mm=measurements.get("thigh_mm"),
-                tricep_mm=measurements.get("tricep_mm"),
-                suprailiac_mm=measurements.get("suprailiac_mm"),
-            )
-        elif method == CalculationMethod.SEVEN_SITE:
-            result = cls.calculate_7_site(
-                gender=gender,
-                age=age,
-                chest_mm=measurements["chest_mm"],
-                midaxillary_mm=measurements["midaxillary_mm"],
-                tricep_mm=measurements["tricep_mm"],
-                subscapular_mm=measurements["subscapular_mm"],
-                abdomen_mm=measurements["abdomen_mm"],
-                suprailiac_mm=measurements["suprailiac_mm"],
-                thigh_mm=measurements["thigh_mm"],
-            )
-        else:
+        calculate_for = _DISPATCH.get((method, gender))
+        if calculate_for is None:
             raise ValueError(f"Invalid calculation method: {method}")
+        result = _finalize(calculate_for(age, height_cm, measurements))
 
         # Validate result is within realistic ranges
         if result < Decimal("5.0"):
@@ -7,7 +7,7 @@ from datetime import datetime
 from decimal import Decimal
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import Exists, and_, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.enums import ActivityLevel, Gender, GoalStatus, GoalType
@@ -18,14 +18,50 @@ from src.models.user import User
 from src.schemas.goal import GoalCreate
 from src.services.plan_generator import PlanGenerator
 
+_ACTIVITY_MULTIPLIERS: dict[ActivityLevel, float] = {
+    ActivityLevel.SEDENTARY: 1.2,
+    ActivityLevel.LIGHTLY_ACTIVE: 1.375,
+    ActivityLevel.MODERATELY_ACTIVE: 1.55,
+    ActivityLevel.VERY_ACTIVE: 1.725,
+    ActivityLevel.EXTREMELY_ACTIVE: 1.9,
+}
+
+# Minimum safe daily calories while cutting
+_MIN_CUT_CALORIES: dict[Gender, int] = {Gender.MALE: 1500, Gender.FEMALE: 1200}
+
+# Average weeks per month for the per-month timeline rates
+_WEEKS_PER_MONTH = 4.33
+
+# Goal safety limits (FR-017)
+_MIN_TARGET_BF: dict[Gender, Decimal] = {
+    Gender.MALE: Decimal("8.0"),
+    Gender.FEMALE: Decimal("15.0"),
+}
+_MAX_CEILING_BF = Decimal("30.0")
+
+
+def _active_goal_exists(user_id: UUID) -> Exists:
+    """
+    EXISTS expression for "user has an active goal" (FR-018).
+
+    EXISTS lets Postgres stop at the first match and skips hydrating a
+    Goal into the session.
+    """
+    return (
+        select(Goal.id)
+        .where(Goal.user_id == user_id)
+        .where(Goal.status == GoalStatus.ACTIVE)
+        .exists()
+    )
+
 
 class GoalService:
     """Service for managing body recomposition goals."""
 
     @staticmethod
     def calculate_bmr(
-        weight_kg: Decimal,
-        height_cm: Decimal,
+        weight_kg: float,
+        height_cm: float,
         age_years: int,
         gender: Gender,
     ) -> int:
@@ -37,11 +73,7 @@ class GoalService:
 
         Returns BMR rounded to nearest integer calorie.
         """
-        bmr = (
-            10 * float(weight_kg)
-            + 6.25 * float(height_cm)
-            - 5 * age_years
-        )
+        bmr = 10 * weight_kg + 6.25 * height_cm - 5 * age_years
 
         if gender == Gender.MALE:
             bmr += 5
@@ -64,15 +96,7 @@ class GoalService:
 
         Returns TDEE rounded to nearest integer calorie.
         """
-        multipliers = {
-            ActivityLevel.SEDENTARY: 1.2,
-            ActivityLevel.LIGHTLY_ACTIVE: 1.375,
-            ActivityLevel.MODERATELY_ACTIVE: 1.55,
-            ActivityLevel.VERY_ACTIVE: 1.725,
-            ActivityLevel.EXTREMELY_ACTIVE: 1.9,
-        }
-
-        tdee = bmr * multipliers[activity_level]
+        tdee = bmr * _ACTIVITY_MULTIPLIERS[activity_level]
         return round(tdee)
 
     @staticmethod
@@ -94,9 +118,7 @@ class GoalService:
         target = tdee - deficit
 
         # Enforce minimum safe limits
-        minimum = 1500 if gender == Gender.MALE else 1200
-
-        return max(target, minimum)
+        return max(target, _MIN_CUT_CALORIES[gender])
 
     @staticmethod
     def calculate_bulking_calories(tdee: int, surplus: int = 250) -> int:
@@ -112,8 +134,8 @@ class GoalService:
 
     @staticmethod
     def estimate_cutting_timeline(
-        current_bf: Decimal,
-        target_bf: Decimal,
+        current_bf: float,
+        target_bf: float,
         rate_per_month: float = 0.75,
     ) -> int:
         """
@@ -126,15 +148,14 @@ class GoalService:
 
         Returns estimated weeks, rounded to nearest integer.
         """
-        bf_difference = float(current_bf - target_bf)
-        rate_per_week = rate_per_month / 4.33
-        weeks = bf_difference / rate_per_week
+        bf_difference = current_bf - target_bf
+        weeks = bf_difference * (_WEEKS_PER_MONTH / rate_per_month)
         return round(weeks)
 
     @staticmethod
     def estimate_bulking_timeline(
-        current_bf: Decimal,
-        ceiling_bf: Decimal,
+        current_bf: float,
+        ceiling_bf: float,
         rate_per_month: float = 0.2,
     ) -> int:
         """
@@ -147,9 +168,8 @@ class GoalService:
 
         Returns estimated weeks, rounded to nearest integer.
         """
-        bf_difference = float(ceiling_bf - current_bf)
-        rate_per_week = rate_per_month / 4.33
-        weeks = bf_difference / rate_per_week
+        bf_difference = ceiling_bf - current_bf
+        weeks = bf_difference * (_WEEKS_PER_MONTH / rate_per_month)
         return round(weeks)
 
     @staticmethod
@@ -180,7 +200,7 @@ class GoalService:
                 )
 
             # Check minimum safe body fat
-            min_bf = Decimal("8.0") if gender == Gender.MALE else Decimal("15.0")
+            min_bf = _MIN_TARGET_BF[gender]
             if target_bf < min_bf:
                 raise ValueError(
                     f"Target body fat too low. "
@@ -201,7 +221,7 @@ class GoalService:
                 )
 
             # Check maximum safe body fat
-            if ceiling_bf > Decimal("30.0"):
+            if ceiling_bf > _MAX_CEILING_BF:
                 raise ValueError(
                     "Ceiling body fat too high. Maximum safe level is 30%"
                 )
@@ -223,12 +243,8 @@ class GoalService:
 
         Returns True if active goal exists, False otherwise.
         """
-        result = await db.execute(
-            select(Goal)
-            .where(Goal.user_id == user_id)
-            .where(Goal.status == GoalStatus.ACTIVE)
-        )
-        return result.scalar_one_or_none() is not None
+        result = await db.execute(select(_active_goal_exists(user_id)))
+        return result.scalar()
 
     async def create_goal(
         self,
@@ -256,28 +272,29 @@ class GoalService:
 
         Returns created Goal with all calculated fields and plans.
         """
+        # Load the user, the initial measurement and the active-goal flag
+        # (FR-018) in a single round trip
+        has_active_goal = _active_goal_exists(user_id).label("has_active_goal")
+        result = await db.execute(
+            select(User, BodyMeasurement, has_active_goal)
+            .outerjoin(
+                BodyMeasurement,
+                BodyMeasurement.id == goal_data.initial_measurement_id,
+            )
+            .where(User.id == user_id)
+        )
+        row = result.one_or_none()
+        if row is None:
+            raise ValueError("User not found")
+        user, measurement, has_active = row
+
         # Check for existing active goal (FR-018)
-        has_active = await self.check_active_goal_exists(db, user_id)
         if has_active:
             raise ValueError(
                 "User already has an active goal. "
                 "Complete or cancel existing goal before creating a new one."
             )
 
-        # Get user
-        result = await db.execute(
-            select(User).where(User.id == user_id)
-        )
-        user = result.scalar_one_or_none()
-        if not user:
-            raise ValueError("User not found")
-
-        # Get initial measurement
-        result = await db.execute(
-            select(BodyMeasurement)
-            .where(BodyMeasurement.id == goal_data.initial_measurement_id)
-        )
-        measurement = result.scalar_one_or_none()
         if not measurement:
             raise ValueError("Initial measurement not found")
 
@@ -296,13 +313,22 @@ class GoalService:
             user.gender,
         )
 
-        # Calculate age from date of birth
-        age = (datetime.utcnow() - user.date_of_birth).days // 365
+        # One timestamp for the whole row so started_at/created_at/
+        # updated_at agree exactly
+        now = datetime.utcnow()
+
+        # Calculate age in whole years from date of birth (leap-aware:
+        # one less if this year's birthday hasn't happened yet)
+        dob = user.date_of_birth
+        age = now.year - dob.year - ((now.month, now.day) < (dob.month, dob.day))
+
+        # The formulas work in floats; convert the Numeric columns once here
+        current_bf = float(measurement.calculated_body_fat_percentage)
 
         # Calculate BMR and TDEE
         bmr = self.calculate_bmr(
-            measurement.weight_kg,
-            user.height_cm,
+            float(measurement.weight_kg),
+            float(user.height_cm),
             age,
             user.gender,
         )
@@ -315,14 +341,14 @@ class GoalService:
                 user.gender,
             )
             estimated_weeks = self.estimate_cutting_timeline(
-                measurement.calculated_body_fat_percentage,
-                goal_data.target_body_fat_percentage,
+                current_bf,
+                float(goal_data.target_body_fat_percentage),
             )
         else:  # BULKING
             target_calories = self.calculate_bulking_calories(tdee)
             estimated_weeks = self.estimate_bulking_timeline(
-                measurement.calculated_body_fat_percentage,
-                goal_data.ceiling_body_fat_percentage,
+                current_bf,
+                float(goal_data.ceiling_body_fat_percentage),
             )
 
         # Create goal
@@ -342,15 +368,18 @@ class GoalService:
                 goal_data.ceiling_body_fat_percentage
             ),
             target_calories=target_calories,
+            bmr_at_creation=bmr,
+            tdee_at_creation=tdee,
             estimated_weeks_to_goal=estimated_weeks,
-            started_at=datetime.utcnow(),
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow(),
+            started_at=now,
+            created_at=now,
+            updated_at=now,
         )
 
+        # Every column is set above (the id default is client-side), so the
+        # flushed goal needs no refresh; eager_defaults covers the rest
         db.add(goal)
         await db.flush()
-        await db.refresh(goal)
 
         # Generate training and diet plans
         plan_generator = PlanGenerator()
@@ -414,32 +443,33 @@ class GoalService:
         Returns:
             True if goal was completed, False otherwise
         """
+        # Push the completion predicate into one UPDATE ... RETURNING so
+        # the check and the status change are a single round trip
         result = await db.execute(
-            select(Goal).where(Goal.id == goal_id)
+            update(Goal)
+            .where(Goal.id == goal_id)
+            .where(Goal.status == GoalStatus.ACTIVE)
+            .where(
+                or_(
+                    # Cutting goal is complete when current BF <= target BF
+                    and_(
+                        Goal.goal_type == GoalType.CUTTING,
+                        Goal.target_body_fat_percentage.is_not(None),
+                        Goal.target_body_fat_percentage >= current_body_fat,
+                    ),
+                    # Bulking goal is complete when current BF >= ceiling BF
+                    and_(
+                        Goal.goal_type == GoalType.BULKING,
+                        Goal.ceiling_body_fat_percentage.is_not(None),
+                        Goal.ceiling_body_fat_percentage <= current_body_fat,
+                    ),
+                )
+            )
+            .values(status=GoalStatus.COMPLETED, completed_at=datetime.utcnow())
+            .returning(Goal.id)
         )
-        goal = result.scalar_one_or_none()
-
-        if not goal or goal.status != GoalStatus.ACTIVE:
+        if result.scalar_one_or_none() is None:
             return False
 
-        completed = False
-
-        if goal.goal_type == GoalType.CUTTING:
-            # Cutting goal is complete when current BF <= target BF
-            if (goal.target_body_fat_percentage and
-                current_body_fat <= goal.target_body_fat_percentage):
-                completed = True
-        else:
-            # Bulking goal is complete when current BF >= ceiling BF
-            if (goal.ceiling_body_fat_percentage and
-                current_body_fat >= goal.ceiling_body_fat_percentage):
-                completed = True
-
-        if completed:
-            goal.status = GoalStatus.COMPLETED
-            goal.completed_at = datetime.utcnow()
-            await db.commit()
-            await db.refresh(goal)
-            return True
-
-        return False
+        await db.commit()
+        return True
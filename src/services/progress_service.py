@@ -2,14 +2,16 @@
 
 Handles progress entry creation, trend analysis, and adjustment suggestions.
 """
+import math
 from datetime import datetime
 from decimal import Decimal
-from typing import Optional
+from typing import Optional, Sequence
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import case, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload, selectinload
 
 from src.models.enums import GoalStatus, GoalType
 from src.models.goal import Goal
@@ -17,6 +19,29 @@ from src.models.measurement import BodyMeasurement
 from src.models.progress import ProgressEntry
 from src.schemas.progress import TrendsResponse
 
+# Expected weekly body fat change ranges for the on-track check
+_CUT_LOSS_PER_WEEK = (0.4, 1.2)
+_BULK_GAIN_PER_WEEK = (0.1, 0.6)
+
+# Average weekly body fat change thresholds for trend classification
+_CUT_IMPROVE = -0.4
+_CUT_PLATEAU = -0.2
+_BULK_LOW = 0.1
+_BULK_MIN = 0.2
+_BULK_MAX = 0.5
+_BULK_HIGH = 0.6
+
+
+def _settle(value: float) -> float:
+    """Round away float noise from a value derived from stored data.
+
+    Body fat and weight columns hold two decimal places, so a derived value
+    that should land exactly on a threshold (e.g. 0.4 * 3 vs 1.20) only
+    misses it by float error. Six places removes that error without moving
+    a genuine value across a two-decimal threshold.
+    """
+    return round(value, 6)
+
 
 class ProgressService:
     """Service for managing progress tracking and analysis."""
@@ -29,7 +54,7 @@ class ProgressService:
         """
         self.db = db
 
-    async def check_bulking_ceiling(
+    def check_bulking_ceiling(
         self,
         current_bf: Decimal,
         ceiling_bf: Decimal,
@@ -61,7 +86,7 @@ class ProgressService:
 
         return None, False
 
-    async def check_bulking_rate(
+    def check_bulking_rate(
         self,
         previous_bf: Decimal,
         current_bf: Decimal,
@@ -110,29 +135,33 @@ class ProgressService:
         Raises:
             ValueError: If measurement too soon (< 7 days), invalid goal, etc.
         """
-        # Fetch goal with relationships
-        goal_result = await self.db.execute(
-            select(Goal)
+        # Fetch the goal, the new measurement and the number of entries
+        # logged so far in one round trip. Only the newest entry matters
+        # below, so the entries themselves aren't loaded.
+        entry_count = (
+            select(func.count())
+            .where(ProgressEntry.goal_id == goal_id)
+            .scalar_subquery()
+        )
+        result = await self.db.execute(
+            select(Goal, BodyMeasurement, entry_count)
+            .outerjoin(BodyMeasurement, BodyMeasurement.id == measurement_id)
             .options(
                 selectinload(Goal.initial_measurement),
-                selectinload(Goal.progress_entries)
+                # Any other relationship access would be a hidden lazy load
+                raiseload("*"),
             )
             .where(Goal.id == goal_id)
         )
-        goal = goal_result.scalar_one_or_none()
+        row = result.one_or_none()
 
-        if not goal:
+        if row is None:
             raise ValueError(f"Goal {goal_id} not found")
+        goal, measurement, logged_weeks = row
 
         if goal.status != GoalStatus.ACTIVE:
             raise ValueError(f"Goal {goal_id} is not active")
 
-        # Fetch new measurement
-        measurement_result = await self.db.execute(
-            select(BodyMeasurement).where(BodyMeasurement.id == measurement_id)
-        )
-        measurement = measurement_result.scalar_one_or_none()
-
         if not measurement:
             raise ValueError(f"Measurement {measurement_id} not found")
 
@@ -141,21 +170,24 @@ class ProgressService:
             raise ValueError("Measurement does not belong to goal's user")
 
         # Determine week number and validate timing
-        week_number = len(goal.progress_entries) + 1
-
-        # Get most recent measurement date
-        if goal.progress_entries:
-            last_entry = max(
-                goal.progress_entries,
-                key=lambda e: e.logged_at
-            )
-            last_measurement_result = await self.db.execute(
-                select(BodyMeasurement).where(
-                    BodyMeasurement.id == last_entry.measurement_id
+        week_number = logged_weeks + 1
+
+        # Measurement behind the most recent entry (ix_progress_goal_time)
+        last_measurement = None
+        if logged_weeks:
+            last_measurement = await self.db.scalar(
+                select(BodyMeasurement)
+                .join(
+                    ProgressEntry,
+                    ProgressEntry.measurement_id == BodyMeasurement.id,
                 )
+                .where(ProgressEntry.goal_id == goal_id)
+                .order_by(ProgressEntry.logged_at.desc())
+                .limit(1)
             )
-            last_measurement = last_measurement_result.scalar_one()
 
+        # Get most recent measurement date
+        if last_measurement is not None:
             days_since_last = (
                 measurement.measured_at - last_measurement.measured_at
             ).days
@@ -208,50 +240,46 @@ class ProgressService:
         if goal.goal_type == GoalType.BULKING:
             # Check ceiling
             if goal.ceiling_body_fat_percentage:
-                ceiling_warning, should_complete = await self.check_bulking_ceiling(
+                ceiling_warning, should_complete = self.check_bulking_ceiling(
                     current_bf=measurement.calculated_body_fat_percentage,
                     ceiling_bf=goal.ceiling_body_fat_percentage,
                     goal=goal
                 )
 
             # Check rate (only if we have previous measurement)
-            if goal.progress_entries:
-                last_entry = max(
-                    goal.progress_entries,
-                    key=lambda e: e.logged_at
-                )
-                last_measurement_result = await self.db.execute(
-                    select(BodyMeasurement).where(
-                        BodyMeasurement.id == last_entry.measurement_id
-                    )
-                )
-                last_measurement = last_measurement_result.scalar_one()
-
-                weeks_between = (
-                    measurement.measured_at - last_measurement.measured_at
-                ).days // 7
-
-                rate_warning = await self.check_bulking_rate(
+            if last_measurement is not None:
+                # Reuse the gap already computed for the timing check
+                rate_warning = self.check_bulking_rate(
                     previous_bf=last_measurement.calculated_body_fat_percentage,
                     current_bf=measurement.calculated_body_fat_percentage,
-                    weeks=max(1, weeks_between)
+                    weeks=max(1, days_since_last // 7)
                 )
 
-        # Create progress entry
-        progress_entry = ProgressEntry(
-            goal_id=goal_id,
-            measurement_id=measurement_id,
-            week_number=week_number,
-            body_fat_percentage=measurement.calculated_body_fat_percentage,
-            weight_kg=measurement.weight_kg,
-            body_fat_change=body_fat_change,
-            weight_change_kg=weight_change,
-            is_on_track=is_on_track,
-            notes=notes,
-            logged_at=datetime.utcnow()
+        # Create progress entry. The unique (goal_id, week_number) index
+        # arbitrates concurrent submissions for the same week in the INSERT
+        # itself, so no pre-SELECT is needed; RETURNING hands back the row.
+        progress_entry = await self.db.scalar(
+            pg_insert(ProgressEntry)
+            .values(
+                goal_id=goal_id,
+                measurement_id=measurement_id,
+                week_number=week_number,
+                body_fat_percentage=measurement.calculated_body_fat_percentage,
+                weight_kg=measurement.weight_kg,
+                body_fat_change=body_fat_change,
+                weight_change_kg=weight_change,
+                is_on_track=is_on_track,
+                notes=notes,
+                logged_at=datetime.utcnow(),
+            )
+            .on_conflict_do_nothing(index_elements=["goal_id", "week_number"])
+            .returning(ProgressEntry)
         )
 
-        self.db.add(progress_entry)
+        if progress_entry is None:
+            raise ValueError(
+                f"Progress for week {week_number} has already been logged"
+            )
 
         # Complete goal if ceiling reached
         if should_complete:
@@ -260,7 +288,6 @@ class ProgressService:
             self.db.add(goal)
 
         await self.db.commit()
-        await self.db.refresh(progress_entry)
 
         # Attach warnings to progress entry for response
         # Note: These are transient attributes for API response
@@ -286,31 +313,28 @@ class ProgressService:
         Returns:
             True if progress meets expected rate
         """
+        change = float(body_fat_change)
+
         if goal.goal_type == GoalType.CUTTING:
             # Expect 0.5-1% body fat loss per week for cutting
-            expected_min_loss = Decimal("0.4") * weeks_elapsed
-            expected_max_loss = Decimal("1.2") * weeks_elapsed
-
-            total_loss = (
-                goal.initial_measurement.calculated_body_fat_percentage -
-                (goal.initial_measurement.calculated_body_fat_percentage + body_fat_change)
-            )
+            min_loss, max_loss = _CUT_LOSS_PER_WEEK
+            expected_min_loss = _settle(min_loss * weeks_elapsed)
+            expected_max_loss = _settle(max_loss * weeks_elapsed)
 
             # On track if within expected range (negative = loss)
-            return expected_min_loss <= abs(total_loss) <= expected_max_loss
+            return expected_min_loss <= abs(change) <= expected_max_loss
         else:
             # Bulking - expect slow body fat increase (0.2-0.5% per week)
-            expected_min_gain = Decimal("0.1") * weeks_elapsed
-            expected_max_gain = Decimal("0.6") * weeks_elapsed
+            min_gain, max_gain = _BULK_GAIN_PER_WEEK
+            expected_min_gain = _settle(min_gain * weeks_elapsed)
+            expected_max_gain = _settle(max_gain * weeks_elapsed)
 
-            total_gain = body_fat_change
-
-            return expected_min_gain <= total_gain <= expected_max_gain
+            return expected_min_gain <= change <= expected_max_gain
 
     async def calculate_progress_percentage(
         self,
         goal_id: UUID
-    ) -> Decimal:
+    ) -> float:
         """Calculate progress percentage toward goal.
 
         Args:
@@ -323,7 +347,8 @@ class ProgressService:
             select(Goal)
             .options(
                 selectinload(Goal.initial_measurement),
-                selectinload(Goal.progress_entries)
+                selectinload(Goal.progress_entries),
+                raiseload("*"),
             )
             .where(Goal.id == goal_id)
         )
@@ -333,37 +358,49 @@ class ProgressService:
             raise ValueError(f"Goal {goal_id} not found")
 
         if not goal.progress_entries:
-            return Decimal("0.0")
+            return 0.0
+
+        # The relationship is ordered by week_number, so the last is latest
+        latest_entry = goal.progress_entries[-1]
+        return self._progress_pct_from_goal(
+            goal, float(latest_entry.body_fat_percentage)
+        )
+
+    def _progress_pct_from_goal(self, goal: Goal, current_bf: float) -> float:
+        """Calculate progress percentage from an already loaded goal.
 
-        # Get current body fat from latest progress entry
-        latest_entry = max(goal.progress_entries, key=lambda e: e.week_number)
-        current_bf = latest_entry.body_fat_percentage
+        Args:
+            goal: Goal with initial_measurement loaded
+            current_bf: Body fat percentage from the latest progress entry
 
-        initial_bf = goal.initial_measurement.calculated_body_fat_percentage
+        Returns:
+            Progress percentage (0-100)
+        """
+        initial_bf = float(goal.initial_measurement.calculated_body_fat_percentage)
 
         if goal.goal_type == GoalType.CUTTING:
             target_bf = goal.target_body_fat_percentage
             if not target_bf:
-                return Decimal("0.0")
+                return 0.0
 
             # Progress = (initial - current) / (initial - target) * 100
             progress = (
                 (initial_bf - current_bf) /
-                (initial_bf - target_bf)
-            ) * Decimal("100")
+                (initial_bf - float(target_bf))
+            ) * 100
         else:
             # Bulking - progress toward ceiling
             ceiling_bf = goal.ceiling_body_fat_percentage
             if not ceiling_bf:
-                return Decimal("0.0")
+                return 0.0
 
             progress = (
                 (current_bf - initial_bf) /
-                (ceiling_bf - initial_bf)
-            ) * Decimal("100")
+                (float(ceiling_bf) - initial_bf)
+            ) * 100
 
         # Clamp to 0-100 range
-        return max(Decimal("0.0"), min(Decimal("100.0"), progress))
+        return max(0.0, min(100.0, progress))
 
     async def get_trends(self, goal_id: UUID) -> TrendsResponse:
         """Get progress trends and analysis for a goal.
@@ -378,7 +415,7 @@ class ProgressService:
             select(Goal)
             .options(
                 selectinload(Goal.initial_measurement),
-                selectinload(Goal.progress_entries)
+                raiseload("*"),
             )
             .where(Goal.id == goal_id)
         )
@@ -387,43 +424,56 @@ class ProgressService:
         if not goal:
             raise ValueError(f"Goal {goal_id} not found")
 
-        progress_entries = sorted(
-            goal.progress_entries,
-            key=lambda e: e.week_number
+        # Aggregate every entry in the database rather than loading them all
+        totals_result = await self.db.execute(
+            select(
+                func.avg(ProgressEntry.body_fat_change),
+                func.avg(ProgressEntry.weight_change_kg),
+                func.sum(case((ProgressEntry.is_on_track, 1), else_=0)),
+                func.count(),
+            ).where(ProgressEntry.goal_id == goal_id)
+        )
+        bf_change_avg, weight_change_avg, on_track_count, weeks_elapsed = (
+            totals_result.one()
         )
 
-        if len(progress_entries) < 2:
+        if weeks_elapsed < 2:
             # Insufficient data for trend analysis
             return TrendsResponse(
                 goal_id=goal_id,
-                progress_percentage=Decimal("0.0"),
-                weeks_elapsed=len(progress_entries),
+                progress_percentage=0.0,
+                weeks_elapsed=weeks_elapsed,
                 is_on_track=False,
-                weekly_bf_change_avg=Decimal("0.0"),
-                weekly_weight_change_avg=Decimal("0.0"),
+                weekly_bf_change_avg=0.0,
+                weekly_weight_change_avg=0.0,
                 trend="insufficient_data",
                 adjustment_suggestion=None,
                 estimated_weeks_remaining=goal.estimated_weeks_to_goal
             )
 
-        # Calculate averages
-        total_bf_change = sum(e.body_fat_change for e in progress_entries)
-        total_weight_change = sum(e.weight_change_kg for e in progress_entries)
-        weeks_elapsed = len(progress_entries)
+        # Only the last three weeks feed the trend, newest first
+        recent_result = await self.db.execute(
+            select(ProgressEntry)
+            .where(ProgressEntry.goal_id == goal_id)
+            .order_by(ProgressEntry.week_number.desc())
+            .limit(3)
+        )
+        recent_entries = recent_result.scalars().all()
+        current_bf = float(recent_entries[0].body_fat_percentage)
 
-        weekly_bf_change_avg = total_bf_change / weeks_elapsed
-        weekly_weight_change_avg = total_weight_change / weeks_elapsed
+        # The analysis below runs on floats; Numeric results are converted here
+        weekly_bf_change_avg = float(bf_change_avg)
+        weekly_weight_change_avg = float(weight_change_avg)
 
-        # Calculate progress percentage
-        progress_pct = await self.calculate_progress_percentage(goal_id)
+        # Calculate progress percentage from the latest entry
+        progress_pct = self._progress_pct_from_goal(goal, current_bf)
 
         # Determine overall on-track status
-        on_track_count = sum(1 for e in progress_entries if e.is_on_track)
         is_on_track = on_track_count / weeks_elapsed >= 0.6  # 60% on track
 
-        # Classify trend
+        # Classify trend (only the last three weeks matter)
         trend = self._classify_trend(
-            progress_entries=progress_entries,
+            bf_changes=[float(e.body_fat_change) for e in reversed(recent_entries)],
             goal_type=goal.goal_type
         )
 
@@ -438,7 +488,7 @@ class ProgressService:
         # Estimate weeks remaining
         estimated_weeks = self._estimate_weeks_remaining(
             goal=goal,
-            current_bf=progress_entries[-1].body_fat_percentage,
+            current_bf=current_bf,
             weekly_bf_change_avg=weekly_bf_change_avg
         )
 
@@ -456,44 +506,43 @@ class ProgressService:
 
     def _classify_trend(
         self,
-        progress_entries: list[ProgressEntry],
+        bf_changes: Sequence[float],
         goal_type: GoalType
     ) -> str:
         """Classify overall progress trend.
 
         Args:
-            progress_entries: List of progress entries (sorted by week)
+            bf_changes: Weekly body fat changes (sorted by week)
             goal_type: Cutting or bulking
 
         Returns:
             Trend classification: 'improving', 'plateau', or 'worsening'
         """
-        if len(progress_entries) < 3:
+        if len(bf_changes) < 3:
             return "insufficient_data"
 
         # Look at last 3 entries to determine trend
-        recent_entries = progress_entries[-3:]
-        changes = [e.body_fat_change for e in recent_entries]
+        changes = bf_changes[-3:]
 
         if goal_type == GoalType.CUTTING:
             # For cutting, negative changes are good (losing fat)
-            avg_change = sum(changes) / len(changes)
+            avg_change = _settle(math.fsum(changes) / len(changes))
 
-            if avg_change < Decimal("-0.4"):  # Good loss rate
+            if avg_change < _CUT_IMPROVE:  # Good loss rate
                 return "improving"
-            elif avg_change > Decimal("-0.2"):  # Slow or no loss
+            elif avg_change > _CUT_PLATEAU:  # Slow or no loss
                 return "plateau"
             else:
                 return "improving"  # Moderate loss
         else:
             # For bulking, positive changes are expected
-            avg_change = sum(changes) / len(changes)
+            avg_change = _settle(math.fsum(changes) / len(changes))
 
-            if Decimal("0.2") <= avg_change <= Decimal("0.5"):
+            if _BULK_MIN <= avg_change <= _BULK_MAX:
                 return "improving"
-            elif avg_change < Decimal("0.1"):
+            elif avg_change < _BULK_LOW:
                 return "plateau"
-            elif avg_change > Decimal("0.6"):
+            elif avg_change > _BULK_HIGH:
                 return "worsening"  # Too much fat gain
             else:
                 return "improving"
@@ -503,7 +552,7 @@ class ProgressService:
         goal: Goal,
         trend: str,
         is_on_track: bool,
-        weekly_bf_change_avg: Decimal
+        weekly_bf_change_avg: float
     ) -> Optional[str]:
         """Generate adjustment suggestions based on progress.
 
@@ -519,6 +568,8 @@ class ProgressService:
         if trend == "insufficient_data":
             return "Keep logging weekly measurements to track progress"
 
+        weekly_bf_change_avg = _settle(weekly_bf_change_avg)
+
         if goal.goal_type == GoalType.CUTTING:
             if trend == "improving" and is_on_track:
                 return "Maintain current plan - excellent progress!"
@@ -527,12 +578,12 @@ class ProgressService:
                     "Progress has slowed. Consider increasing daily deficit "
                     "by 100-200 calories or adding 1-2 cardio sessions per week."
                 )
-            elif not is_on_track and weekly_bf_change_avg > Decimal("-0.3"):
+            elif not is_on_track and weekly_bf_change_avg > -0.3:
                 return (
                     "Progress slower than expected. Verify calorie tracking "
                     "accuracy and consider increasing training volume."
                 )
-            elif weekly_bf_change_avg < Decimal("-1.0"):
+            elif weekly_bf_change_avg < -1.0:
                 return (
                     "Progress faster than expected - you may be losing muscle. "
                     "Consider reducing deficit by 100-200 calories."
@@ -559,8 +610,8 @@ class ProgressService:
     def _estimate_weeks_remaining(
         self,
         goal: Goal,
-        current_bf: Decimal,
-        weekly_bf_change_avg: Decimal
+        current_bf: float,
+        weekly_bf_change_avg: float
     ) -> Optional[int]:
         """Estimate weeks remaining to reach goal.
 
@@ -572,7 +623,7 @@ class ProgressService:
         Returns:
             Estimated weeks remaining or None if not calculable
         """
-        if weekly_bf_change_avg == 0:
+        if _settle(weekly_bf_change_avg) == 0:
             return None
 
         if goal.goal_type == GoalType.CUTTING:
@@ -580,7 +631,7 @@ class ProgressService:
             if not target_bf:
                 return None
 
-            remaining_bf = current_bf - target_bf
+            remaining_bf = current_bf - float(target_bf)
 
             if remaining_bf <= 0:
                 return 0  # Goal already reached
@@ -592,11 +643,12 @@ class ProgressService:
             if not ceiling_bf:
                 return None
 
-            remaining_bf = ceiling_bf - current_bf
+            remaining_bf = float(ceiling_bf) - current_bf
 
             if remaining_bf <= 0:
                 return 0  # Goal already reached
 
             weeks = remaining_bf / weekly_bf_change_avg
 
+        weeks = _settle(weeks)
         return int(weeks) if weeks > 0 else 0
@@ -10,27 +10,40 @@ from src.models.enums import Gender
 class MeasurementValidator:
     """Service for validating body measurements."""
 
+    # Bounds are coarse sanity checks, so they are floats and inputs are
+    # converted once with float() before comparing.
+
     # Body fat percentage ranges
-    MIN_BODY_FAT_MALE = Decimal("5.0")
-    MAX_BODY_FAT_MALE = Decimal("50.0")
-    MIN_BODY_FAT_FEMALE = Decimal("8.0")
-    MAX_BODY_FAT_FEMALE = Decimal("50.0")
+    MIN_BODY_FAT_MALE = 5.0
+    MAX_BODY_FAT_MALE = 50.0
+    MIN_BODY_FAT_FEMALE = 8.0
+    MAX_BODY_FAT_FEMALE = 50.0
 
     # Safe target limits
-    SAFE_MIN_TARGET_MALE = Decimal("8.0")
-    SAFE_MIN_TARGET_FEMALE = Decimal("15.0")
+    SAFE_MIN_TARGET_MALE = 8.0
+    SAFE_MIN_TARGET_FEMALE = 15.0
+
+    # Per-gender lookups of the limits above
+    _BF_RANGE: dict[Gender, tuple[float, float]] = {
+        Gender.MALE: (MIN_BODY_FAT_MALE, MAX_BODY_FAT_MALE),
+        Gender.FEMALE: (MIN_BODY_FAT_FEMALE, MAX_BODY_FAT_FEMALE),
+    }
+    _SAFE_MIN_TARGET: dict[Gender, float] = {
+        Gender.MALE: SAFE_MIN_TARGET_MALE,
+        Gender.FEMALE: SAFE_MIN_TARGET_FEMALE,
+    }
 
     # Weight ranges (kg)
-    MIN_WEIGHT = Decimal("30.0")
-    MAX_WEIGHT = Decimal("300.0")
+    MIN_WEIGHT = 30.0
+    MAX_WEIGHT = 300.0
 
     # Circumference ranges (cm)
-    MIN_CIRCUMFERENCE = Decimal("10.0")
-    MAX_CIRCUMFERENCE = Decimal("200.0")
+    MIN_CIRCUMFERENCE = 10.0
+    MAX_CIRCUMFERENCE = 200.0
 
     # Skinfold ranges (mm)
-    MIN_SKINFOLD = Decimal("1.0")
-    MAX_SKINFOLD = Decimal("60.0")
+    MIN_SKINFOLD = 1.0
+    MAX_SKINFOLD = 60.0
 
     @classmethod
     def validate_body_fat_range(
@@ -48,16 +61,12 @@ class MeasurementValidator:
         Returns:
             Tuple of (is_valid, error_message)
         """
-        if gender == Gender.MALE:
-            min_bf = cls.MIN_BODY_FAT_MALE
-            max_bf = cls.MAX_BODY_FAT_MALE
-        else:
-            min_bf = cls.MIN_BODY_FAT_FEMALE
-            max_bf = cls.MAX_BODY_FAT_FEMALE
-
-        if body_fat_percentage < min_bf:
+        min_bf, max_bf = cls._BF_RANGE[gender]
+
+        bf = float(body_fat_percentage)
+        if bf < min_bf:
             return False, f"Body fat percentage too low (minimum {min_bf}%)"
-        elif body_fat_percentage > max_bf:
+        elif bf > max_bf:
             return False, f"Body fat percentage too high (maximum {max_bf}%)"
 
         return True, None
@@ -78,12 +87,9 @@ class MeasurementValidator:
         Returns:
             Tuple of (is_valid, error_message)
         """
-        if gender == Gender.MALE:
-            safe_min = cls.SAFE_MIN_TARGET_MALE
-        else:
-            safe_min = cls.SAFE_MIN_TARGET_FEMALE
+        safe_min = cls._SAFE_MIN_TARGET[gender]
 
-        if target_body_fat < safe_min:
+        if float(target_body_fat) < safe_min:
             return (
                 False,
                 f"Target body fat too low for safety. "
@@ -103,9 +109,10 @@ class MeasurementValidator:
         Returns:
             Tuple of (is_valid, error_message)
         """
-        if weight_kg < cls.MIN_WEIGHT:
+        weight = float(weight_kg)
+        if weight < cls.MIN_WEIGHT:
             return False, f"Weight too low (minimum {cls.MIN_WEIGHT} kg)"
-        elif weight_kg > cls.MAX_WEIGHT:
+        elif weight > cls.MAX_WEIGHT:
             return False, f"Weight too high (maximum {cls.MAX_WEIGHT} kg)"
 
         return True, None
@@ -126,12 +133,13 @@ class MeasurementValidator:
         Returns:
             Tuple of (is_valid, error_message)
         """
-        if value < cls.MIN_CIRCUMFERENCE:
+        cm = float(value)
+        if cm < cls.MIN_CIRCUMFERENCE:
             return (
                 False,
                 f"{measurement_name} too small (minimum {cls.MIN_CIRCUMFERENCE} cm)"
             )
-        elif value > cls.MAX_CIRCUMFERENCE:
+        elif cm > cls.MAX_CIRCUMFERENCE:
             return (
                 False,
                 f"{measurement_name} too large (maximum {cls.MAX_CIRCUMFERENCE} cm)"
@@ -155,12 +163,13 @@ class MeasurementValidator:
         Returns:
             Tuple of (is_valid, error_message)
         """
-        if value < cls.MIN_SKINFOLD:
+        mm = float(value)
+        if mm < cls.MIN_SKINFOLD:
             return (
                 False,
                 f"{measurement_name} too small (minimum {cls.MIN_SKINFOLD} mm)"
             )
-        elif value > cls.MAX_SKINFOLD:
+        elif mm > cls.MAX_SKINFOLD:
             return (
                 False,
                 f"{measurement_name} too large (maximum {cls.MAX_SKINFOLD} mm)"
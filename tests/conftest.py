@@ -2,10 +2,15 @@
 Pytest configuration and fixtures for Body Recomp Backend testing.
 """
 import asyncio
+import os
+from datetime import date, datetime
+from decimal import Decimal
+from functools import lru_cache
 from typing import AsyncGenerator, Generator
 import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import make_url, text
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
@@ -13,30 +18,98 @@ from sqlalchemy.ext.asyncio import (
 )
 from sqlalchemy.pool import NullPool
 
+try:
+    import uvloop
+except ImportError:  # uvicorn[standard] skips uvloop on Windows and PyPy
+    uvloop = None
+
 from src.core.database import Base
 from src.api.main import app
 from src.core.database import get_db
 from src.core.config import settings
+from src.core import security
+from src.core.security import get_password_hash
+# The package import registers every model on Base.metadata up front
+from src.models import (
+    ActivityLevel,
+    BodyMeasurement,
+    CalculationMethod,
+    Gender,
+    Goal,
+    GoalStatus,
+    GoalType,
+    User,
+)
 
-# Test database URL (using different database for tests)
+# Test database URL (using different database for tests). Each
+# pytest-xdist worker gets its own database so workers never share rows.
+_XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER")
 TEST_DATABASE_URL = settings.DATABASE_URL.replace(
     "/body_recomp",
-    "/body_recomp_test",
+    f"/body_recomp_test_{_XDIST_WORKER}" if _XDIST_WORKER else "/body_recomp_test",
 )
 
 
+# create_all emits the other enum types from the models. goalstatus is
+# created up front because the migrations also give it the lower-case
+# labels that the goals.status server default uses.
+GOALSTATUS_TYPE = """
+    CREATE TYPE goalstatus AS ENUM (
+        'ACTIVE',
+        'COMPLETED',
+        'CANCELLED',
+        'active',
+        'completed',
+        'cancelled'
+    )
+"""
+
+
+# bcrypt at the production cost dominates the suite's run time. Tests
+# hash and verify with 4 rounds; the hash format is unchanged, and
+# test_security checks hashing against the production context.
+PRODUCTION_PWD_CONTEXT = security.pwd_context
+security.pwd_context = PRODUCTION_PWD_CONTEXT.copy(bcrypt__rounds=4)
+
+
+@lru_cache(maxsize=32)
+def hash_password(password: str) -> str:
+    """Hash a test password once; bcrypt is deliberately slow."""
+    return get_password_hash(password)
+
+
+def make_user(email: str, password: str = "testpassword123", **overrides) -> User:
+    """Build an unsaved User with default profile fields for tests."""
+    fields = {
+        "full_name": "Test User",
+        "date_of_birth": date(1990, 1, 1),
+        "gender": Gender.MALE,
+        "height_cm": 175.0,
+        "preferred_calculation_method": CalculationMethod.NAVY,
+        "activity_level": ActivityLevel.MODERATELY_ACTIVE,
+    }
+    fields.update(overrides)
+    return User(email=email, hashed_password=hash_password(password), **fields)
+
+
 @pytest.fixture(scope="session")
 def event_loop() -> Generator:
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
+    """Create the event loop for the test session, uvloop when available."""
+    if uvloop is not None:
+        loop = uvloop.new_event_loop()
+    else:
+        loop = asyncio.get_event_loop_policy().new_event_loop()
     yield loop
     loop.close()
 
 
-# Create test engine
+# Create test engine. A small pool keeps connections open across tests
 test_engine = create_async_engine(
     TEST_DATABASE_URL,
-    poolclass=NullPool,
+    pool_size=5,
+    max_overflow=0,
+    pool_pre_ping=True,
+    pool_recycle=1800,
     echo=False,
 )
 
@@ -47,107 +120,102 @@ test_session_maker = async_sessionmaker(
 )
 
 
-@pytest_asyncio.fixture(scope="function")
-async def db_session() -> AsyncGenerator[AsyncSession, None]:
+async def _create_test_database() -> None:
+    """Create the test database through the maintenance database if missing."""
+    url = make_url(TEST_DATABASE_URL)
+    admin_engine = create_async_engine(
+        url.set(database="postgres"),
+        poolclass=NullPool,
+        isolation_level="AUTOCOMMIT",
+    )
+    async with admin_engine.connect() as conn:
+        exists = await conn.scalar(
+            text("SELECT 1 FROM pg_database WHERE datname = :name"),
+            {"name": url.database},
+        )
+        if not exists:
+            await conn.execute(text(f'CREATE DATABASE "{url.database}"'))
+    await admin_engine.dispose()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def _schema() -> AsyncGenerator[None, None]:
     """
-    Create a test database session.
-    Creates all tables before test and drops them after.
+    Create the test schema once for the whole session.
+    Drops any schema left behind by an interrupted run first, and closes
+    the pooled connections at the end of the session.
     """
-    from sqlalchemy import text
+    await _create_test_database()
 
     async with test_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+
         # Reset enum types so test schema stays aligned with migrations.
-        await conn.execute(text("DROP TYPE IF EXISTS goalstatus CASCADE"))
-        await conn.execute(text("DROP TYPE IF EXISTS goaltype CASCADE"))
-        await conn.execute(text("DROP TYPE IF EXISTS activitylevel CASCADE"))
-        await conn.execute(
-            text("DROP TYPE IF EXISTS calculationmethod CASCADE")
-        )
-        await conn.execute(text("DROP TYPE IF EXISTS gender CASCADE"))
-
-        # Create enum types first
-        await conn.execute(text("""
-            DO $$ BEGIN
-                CREATE TYPE gender AS ENUM ('male', 'female');
-            EXCEPTION
-                WHEN duplicate_object THEN null;
-            END $$;
-        """))
-
-        await conn.execute(text("""
-            DO $$ BEGIN
-                CREATE TYPE calculationmethod AS ENUM (
-                    'navy', '3_site', '7_site'
-                );
-            EXCEPTION
-                WHEN duplicate_object THEN null;
-            END $$;
-        """))
-
-        await conn.execute(text("""
-            DO $$ BEGIN
-                CREATE TYPE activitylevel AS ENUM (
-                    'sedentary', 'lightly_active', 'moderately_active',
-                    'very_active', 'extremely_active'
-                );
-            EXCEPTION
-                WHEN duplicate_object THEN null;
-            END $$;
-        """))
-
-        await conn.execute(text("""
-            DO $$ BEGIN
-                CREATE TYPE goaltype AS ENUM ('CUTTING', 'BULKING');
-            EXCEPTION
-                WHEN duplicate_object THEN null;
-            END $$;
-        """))
-
-        await conn.execute(text("""
-            DO $$ BEGIN
-                CREATE TYPE goalstatus AS ENUM (
-                    'ACTIVE',
-                    'COMPLETED',
-                    'CANCELLED',
-                    'active',
-                    'completed',
-                    'cancelled'
-                );
-            EXCEPTION
-                WHEN duplicate_object THEN null;
-            END $$;
-        """))
+        await conn.execute(text(
+            "DROP TYPE IF EXISTS goalstatus, goaltype, activitylevel, "
+            "calculationmethod, gender CASCADE"
+        ))
+
+        # Create the enum type create_all can't derive from the models
+        await conn.execute(text(GOALSTATUS_TYPE))
 
         # Now create all tables
         await conn.run_sync(Base.metadata.create_all)
 
-    async with test_session_maker() as session:
-        yield session
-        await session.rollback()
+    yield
 
     async with test_engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
+    await test_engine.dispose()
+
+
+@pytest_asyncio.fixture(scope="function")
+async def db_session(_schema: None) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Create a test database session.
+    The session runs inside a transaction that is rolled back after the
+    test; commits made by the code under test only release savepoints.
+    """
+    async with test_engine.connect() as conn:
+        transaction = await conn.begin()
+        async with test_session_maker(
+            bind=conn,
+            join_transaction_mode="create_savepoint",
+        ) as session:
+            yield session
+        await transaction.rollback()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def _client() -> AsyncGenerator[AsyncClient, None]:
+    """
+    Create one HTTP client shared by every API test in the session.
+    """
+    transport = ASGITransport(app=app)
+    async with AsyncClient(
+        transport=transport,
+        base_url="http://test",
+    ) as test_client:
+        yield test_client
 
 
 @pytest_asyncio.fixture(scope="function")
 async def client(
+    _client: AsyncClient,
     db_session: AsyncSession,
 ) -> AsyncGenerator[AsyncClient, None]:
     """
     Create an HTTP client for testing API endpoints.
+    Routes the shared client's requests to this test's session.
     """
     async def override_get_db() -> AsyncGenerator[AsyncSession, None]:
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
 
-    transport = ASGITransport(app=app)
-    async with AsyncClient(
-        transport=transport,
-        base_url="http://test",
-    ) as test_client:
-        yield test_client
+    yield _client
 
+    _client.cookies.clear()
     app.dependency_overrides.clear()
 
 
@@ -156,24 +224,9 @@ async def test_user(db_session: AsyncSession) -> dict:
     """
     Create a test user in the database.
     """
-    from datetime import date
-    from src.models.user import User
-    from src.core.security import get_password_hash
-    from src.models.enums import Gender, CalculationMethod, ActivityLevel
-
-    user = User(
-        email="test@example.com",
-        hashed_password=get_password_hash("testpassword123"),
-        full_name="Test User",
-        date_of_birth=date(1990, 1, 1),
-        gender=Gender.MALE,
-        height_cm=175.0,
-        preferred_calculation_method=CalculationMethod.NAVY,
-        activity_level=ActivityLevel.MODERATELY_ACTIVE,
-    )
+    user = make_user("test@example.com")
     db_session.add(user)
     await db_session.commit()
-    await db_session.refresh(user)
 
     return {
         "id": str(user.id),
@@ -209,11 +262,6 @@ async def test_measurement(
     """
     Create a test measurement for goal creation tests.
     """
-    from datetime import datetime
-    from src.models.measurement import BodyMeasurement
-    from src.models.enums import CalculationMethod
-    from decimal import Decimal
-
     measurement = BodyMeasurement(
         user_id=test_user["id"],
         weight_kg=Decimal("80.0"),
@@ -228,7 +276,6 @@ async def test_measurement(
 
     db_session.add(measurement)
     await db_session.commit()
-    await db_session.refresh(measurement)
 
     return {
         "id": str(measurement.id),
@@ -248,11 +295,6 @@ async def test_goal(
     """
     Create a test goal for goal retrieval tests.
     """
-    from datetime import datetime
-    from src.models.goal import Goal
-    from src.models.enums import GoalType, GoalStatus
-    from decimal import Decimal
-
     goal = Goal(
         user_id=test_user["id"],
         goal_type=GoalType.CUTTING,
@@ -271,7 +313,6 @@ async def test_goal(
 
     db_session.add(goal)
     await db_session.commit()
-    await db_session.refresh(goal)
 
     return {
         "id": str(goal.id),
@@ -286,37 +327,19 @@ async def other_user_goal(db_session: AsyncSession) -> dict:
     """
     Create another user with measurement and goal for isolation tests.
     """
-    from datetime import datetime, date
-    from src.models.user import User
-    from src.models.measurement import BodyMeasurement
-    from src.models.goal import Goal
-    from src.models.enums import (
-        Gender,
-        CalculationMethod,
-        ActivityLevel,
-        GoalType,
-        GoalStatus,
-    )
-    from src.core.security import get_password_hash
-    from decimal import Decimal
-
     # Create other user
-    other_user = User(
-        email="other@example.com",
-        hashed_password=get_password_hash("testpassword123"),
+    other_user = make_user(
+        "other@example.com",
         full_name="Other User",
         date_of_birth=date(1992, 3, 20),
         gender=Gender.FEMALE,
         height_cm=Decimal("165.0"),
-        preferred_calculation_method=CalculationMethod.NAVY,
         activity_level=ActivityLevel.LIGHTLY_ACTIVE,
     )
-    db_session.add(other_user)
-    await db_session.flush()
 
     # Create measurement for other user
     other_measurement = BodyMeasurement(
-        user_id=other_user.id,
+        user=other_user,
         weight_kg=Decimal("65.0"),
         calculation_method=CalculationMethod.NAVY,
         waist_cm=Decimal("75.0"),
@@ -326,15 +349,14 @@ async def other_user_goal(db_session: AsyncSession) -> dict:
         measured_at=datetime.now(),
         created_at=datetime.now(),
     )
-    db_session.add(other_measurement)
-    await db_session.flush()
 
-    # Create goal for other user
+    # Create goal for other user; the relationships resolve the foreign
+    # keys so all three rows go out in a single flush
     other_goal = Goal(
-        user_id=other_user.id,
+        user=other_user,
         goal_type=GoalType.CUTTING,
         status=GoalStatus.ACTIVE,
-        initial_measurement_id=other_measurement.id,
+        initial_measurement=other_measurement,
         initial_body_fat_percentage=Decimal("25.0"),
         target_body_fat_percentage=Decimal("20.0"),
         ceiling_body_fat_percentage=None,
@@ -345,9 +367,8 @@ async def other_user_goal(db_session: AsyncSession) -> dict:
         created_at=datetime.now(),
         updated_at=datetime.now(),
     )
-    db_session.add(other_goal)
+    db_session.add_all([other_user, other_measurement, other_goal])
     await db_session.commit()
-    await db_session.refresh(other_goal)
 
     return {
         "id": str(other_goal.id),
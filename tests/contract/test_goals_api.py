@@ -2,14 +2,35 @@
 Contract tests for Goals API endpoints.
 Validates OpenAPI specification compliance for goal management.
 """
-from fastapi.testclient import TestClient
+from httpx import AsyncClient
+
+# Fields every goal response carries per the OpenAPI spec
+GOAL_RESPONSE_FIELDS = frozenset({
+    "id",
+    "user_id",
+    "goal_type",
+    "status",
+    "initial_measurement_id",
+    "initial_body_fat_percentage",
+    "target_body_fat_percentage",
+    "initial_weight_kg",
+    "target_calories",
+    "estimated_weeks_to_goal",
+    "current_body_fat_percentage",
+    "progress_percentage",
+    "weeks_elapsed",
+    "is_on_track",
+    "started_at",
+    "created_at",
+    "updated_at",
+})
 
 
 class TestGoalCreation:
     """Contract tests for POST /api/v1/goals."""
 
     async def test_create_cutting_goal(
-        self, client: TestClient, auth_headers: dict, test_measurement: dict
+        self, client: AsyncClient, auth_headers: dict, test_measurement: dict
     ):
         """
         Test creating a cutting goal with caloric deficit.
@@ -44,23 +65,8 @@ class TestGoalCreation:
         data = response.json()
 
         # Validate response schema per OpenAPI spec
-        assert "id" in data
-        assert "user_id" in data
-        assert "goal_type" in data
-        assert "status" in data
-        assert "initial_measurement_id" in data
-        assert "initial_body_fat_percentage" in data
-        assert "target_body_fat_percentage" in data
-        assert "initial_weight_kg" in data
-        assert "target_calories" in data
-        assert "estimated_weeks_to_goal" in data
-        assert "current_body_fat_percentage" in data
-        assert "progress_percentage" in data
-        assert "weeks_elapsed" in data
-        assert "is_on_track" in data
-        assert "started_at" in data
-        assert "created_at" in data
-        assert "updated_at" in data
+        missing = GOAL_RESPONSE_FIELDS - data.keys()
+        assert not missing, missing
 
         # Validate goal values
         assert data["goal_type"] == "CUTTING"
@@ -76,7 +82,7 @@ class TestGoalCreation:
         )
 
     async def test_create_bulking_goal(
-        self, client: TestClient, auth_headers: dict, test_measurement: dict
+        self, client: AsyncClient, auth_headers: dict, test_measurement: dict
     ):
         """Test creating a bulking goal with caloric surplus."""
         # Arrange
@@ -104,7 +110,7 @@ class TestGoalCreation:
         assert data["target_calories"] > 0
 
     async def test_create_goal_unsafe_target(
-        self, client: TestClient, auth_headers: dict, test_measurement: dict
+        self, client: AsyncClient, auth_headers: dict, test_measurement: dict
     ):
         """
         Test goal creation fails with unsafe target body fat.
@@ -134,7 +140,7 @@ class TestGoalCreation:
         assert "safe" in data["detail"].lower() or "low" in data["detail"].lower()
 
     async def test_create_goal_requires_measurement(
-        self, client: TestClient, auth_headers: dict
+        self, client: AsyncClient, auth_headers: dict
     ):
         """
         Test goal creation requires an initial measurement.
@@ -162,7 +168,7 @@ class TestGoalCreation:
         assert "detail" in data
 
     async def test_create_goal_one_active_per_user(
-        self, client: TestClient, auth_headers: dict, test_measurement: dict
+        self, client: AsyncClient, auth_headers: dict, test_measurement: dict
     ):
         """
         Test only one active goal allowed per user.
@@ -205,7 +211,7 @@ class TestGoalCreation:
         assert "active" in data["detail"].lower()
 
     async def test_bulking_ceiling_alert(
-        self, client: TestClient, auth_headers: dict
+        self, client: AsyncClient, auth_headers: dict
     ):
         """
         Test bulking goal creation with ceiling validation.
@@ -285,7 +291,7 @@ class TestGoalRetrieval:
     """Contract tests for GET /api/v1/goals/{id}."""
 
     async def test_get_goal_by_id(
-        self, client: TestClient, auth_headers: dict, test_goal: dict
+        self, client: AsyncClient, auth_headers: dict, test_goal: dict
     ):
         """
         Test retrieving a goal by ID.
@@ -311,14 +317,11 @@ class TestGoalRetrieval:
 
         # Validate complete goal details per OpenAPI spec
         assert data["id"] == test_goal["id"]
-        assert "current_body_fat_percentage" in data
-        assert "target_body_fat_percentage" in data
-        assert "estimated_weeks_to_goal" in data
-        assert "target_calories" in data
-        assert "started_at" in data
+        missing = GOAL_RESPONSE_FIELDS - data.keys()
+        assert not missing, missing
 
     async def test_get_goal_not_found(
-        self, client: TestClient, auth_headers: dict
+        self, client: AsyncClient, auth_headers: dict
     ):
         """Test retrieving non-existent goal returns 404."""
         # Arrange
@@ -333,7 +336,7 @@ class TestGoalRetrieval:
         # Assert
         assert response.status_code == 404
 
-    async def test_get_goal_requires_authentication(self, client: TestClient):
+    async def test_get_goal_requires_authentication(self, client: AsyncClient):
         """Test goal retrieval requires authentication."""
         # Arrange
         fake_id = "00000000-0000-0000-0000-000000000000"
@@ -345,7 +348,7 @@ class TestGoalRetrieval:
         assert response.status_code == 401
 
     async def test_get_goal_user_isolation(
-        self, client: TestClient, auth_headers: dict, other_user_goal: dict
+        self, client: AsyncClient, auth_headers: dict, other_user_goal: dict
     ):
         """
         Test users cannot access other users' goals.
@@ -5,14 +5,25 @@ Validates OpenAPI specification compliance for body measurement tracking.
 from datetime import datetime
 from decimal import Decimal
 
-from fastapi.testclient import TestClient
+from httpx import AsyncClient
+
+# Fields every measurement response carries per the OpenAPI spec
+MEASUREMENT_RESPONSE_FIELDS = frozenset({
+    "id",
+    "user_id",
+    "weight_kg",
+    "calculated_body_fat_percentage",
+    "calculation_method",
+    "measured_at",
+    "created_at",
+})
 
 
 class TestMeasurementCreation:
     """Contract tests for POST /api/v1/measurements."""
 
     async def test_create_initial_measurement(
-        self, client: TestClient, auth_headers: dict
+        self, client: AsyncClient, auth_headers: dict
     ):
         """
         Test creating initial body measurement with body fat calculation.
@@ -49,13 +60,8 @@ class TestMeasurementCreation:
         data = response.json()
 
         # Validate response schema
-        assert "id" in data
-        assert "user_id" in data
-        assert "weight_kg" in data
-        assert "calculated_body_fat_percentage" in data
-        assert "calculation_method" in data
-        assert "measured_at" in data
-        assert "created_at" in data
+        missing = MEASUREMENT_RESPONSE_FIELDS - data.keys()
+        assert not missing, missing
 
         # Validate calculated body fat
         assert data["calculated_body_fat_percentage"] is not None
@@ -72,7 +78,7 @@ class TestMeasurementCreation:
         assert data["neck_cm"] == measurement_data["neck_cm"]
 
     async def test_create_measurement_3_site_male(
-        self, client: TestClient, auth_headers: dict
+        self, client: AsyncClient, auth_headers: dict
     ):
         """Test creating measurement with 3-site skinfold method (male)."""
         # Arrange - 3-Site method (male)
@@ -99,7 +105,7 @@ class TestMeasurementCreation:
         assert data["calculation_method"] == "3_site"
 
     async def test_create_measurement_missing_required_fields(
-        self, client: TestClient, auth_headers: dict
+        self, client: AsyncClient, auth_headers: dict
     ):
         """
         Test measurement creation fails with missing required fields.
@@ -129,7 +135,7 @@ class TestMeasurementCreation:
         assert "detail" in data
 
     async def test_create_measurement_invalid_weight(
-        self, client: TestClient, auth_headers: dict
+        self, client: AsyncClient, auth_headers: dict
     ):
         """
         Test measurement creation fails with invalid weight.
@@ -157,7 +163,7 @@ class TestMeasurementCreation:
         assert response.status_code == 422
 
     async def test_create_measurement_requires_authentication(
-        self, client: TestClient
+        self, client: AsyncClient
     ):
         """
         Test measurement creation requires authentication.
@@ -10,6 +10,8 @@ from uuid import uuid4
 import pytest
 from httpx import AsyncClient
 
+from src.core.security import create_access_token
+
 
 @pytest.mark.asyncio
 class TestTrainingPlanContracts:
@@ -39,14 +41,9 @@ class TestTrainingPlanContracts:
         register_response = await client.post("/api/v1/users", json=user_data)
         assert register_response.status_code == 201
 
-        # Step 2: Login
-        login_response = await client.post(
-            "/api/v1/auth/login",
-            json={"email": user_data["email"], "password": user_data["password"]},
-        )
-        assert login_response.status_code == 200
-        tokens = login_response.json()
-        auth_headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+        # Step 2: Mint a token; logging in is covered by test_auth_api
+        token = create_access_token(data={"sub": register_response.json()["id"]})
+        auth_headers = {"Authorization": f"Bearer {token}"}
 
         # Step 3: Create measurement at 25% BF
         measurement_data = {
@@ -135,14 +132,9 @@ class TestTrainingPlanContracts:
         register_response = await client.post("/api/v1/users", json=user_data)
         assert register_response.status_code == 201
 
-        # Step 2: Login
-        login_response = await client.post(
-            "/api/v1/auth/login",
-            json={"email": user_data["email"], "password": user_data["password"]},
-        )
-        assert login_response.status_code == 200
-        tokens = login_response.json()
-        auth_headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+        # Step 2: Mint a token; logging in is covered by test_auth_api
+        token = create_access_token(data={"sub": register_response.json()["id"]})
+        auth_headers = {"Authorization": f"Bearer {token}"}
 
         # Step 3: Create measurement at 12% BF (lean)
         measurement_data = {
@@ -224,13 +216,9 @@ class TestTrainingPlanContracts:
         register_response = await client.post("/api/v1/users", json=user_data)
         assert register_response.status_code == 201
 
-        login_response = await client.post(
-            "/api/v1/auth/login",
-            json={"email": user_data["email"], "password": user_data["password"]},
-        )
-        assert login_response.status_code == 200
-        tokens = login_response.json()
-        auth_headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+        # Mint a token; logging in is covered by test_auth_api
+        token = create_access_token(data={"sub": register_response.json()["id"]})
+        auth_headers = {"Authorization": f"Bearer {token}"}
 
         # Try to get plan for non-existent goal
         fake_goal_id = str(uuid4())
@@ -268,14 +256,9 @@ class TestDietPlanContracts:
         register_response = await client.post("/api/v1/users", json=user_data)
         assert register_response.status_code == 201
 
-        # Step 2: Login
-        login_response = await client.post(
-            "/api/v1/auth/login",
-            json={"email": user_data["email"], "password": user_data["password"]},
-        )
-        assert login_response.status_code == 200
-        tokens = login_response.json()
-        auth_headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+        # Step 2: Mint a token; logging in is covered by test_auth_api
+        token = create_access_token(data={"sub": register_response.json()["id"]})
+        auth_headers = {"Authorization": f"Bearer {token}"}
 
         # Step 3: Create measurement
         measurement_data = {
@@ -10,6 +10,8 @@ from uuid import uuid4
 import pytest
 from httpx import AsyncClient
 
+from src.core.security import create_access_token
+
 
 @pytest.mark.asyncio
 class TestProgressContractTests:
@@ -141,6 +143,27 @@ class TestProgressContractTests:
 
         assert response.status_code == 404
 
+    async def test_log_progress_entry_invalid_body_fails(
+        self, client: AsyncClient, test_user_with_goal
+    ):
+        """Test POST /api/v1/goals/{goal_id}/progress - reject malformed body.
+
+        Contract: Request body validation
+        Expected: 422 with errors located under "body"
+        """
+        goal_id = test_user_with_goal["goal_id"]
+        auth_headers = test_user_with_goal["auth_headers"]
+
+        response = await client.post(
+            f"/api/v1/goals/{goal_id}/progress",
+            json={"measurement_id": "not-a-uuid", "notes": "x" * 1001},
+            headers=auth_headers
+        )
+
+        assert response.status_code == 422
+        fields = {error["field"] for error in response.json()["errors"]}
+        assert fields == {"body.measurement_id", "body.notes"}
+
     async def test_get_progress_history_success(
         self, client: AsyncClient, test_user_with_goal_and_progress
     ):
@@ -447,16 +470,9 @@ class TestBulkingProgressContracts:
         register_response = await client.post("/api/v1/users", json=user_data)
         assert register_response.status_code == 201
 
-        login_response = await client.post(
-            "/api/v1/auth/login",
-            json={
-                "email": user_data["email"],
-                "password": user_data["password"],
-            },
-        )
-        assert login_response.status_code == 200
-        tokens = login_response.json()
-        auth_headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+        # Mint a token; logging in is covered by test_auth_api
+        token = create_access_token(data={"sub": register_response.json()["id"]})
+        auth_headers = {"Authorization": f"Bearer {token}"}
 
         # Step 2: Create initial measurement at ~12% BF
         measurement_data = {
@@ -564,16 +580,9 @@ class TestBulkingProgressContracts:
         register_response = await client.post("/api/v1/users", json=user_data)
         assert register_response.status_code == 201
 
-        login_response = await client.post(
-            "/api/v1/auth/login",
-            json={
-                "email": user_data["email"],
-                "password": user_data["password"],
-            },
-        )
-        assert login_response.status_code == 200
-        tokens = login_response.json()
-        auth_headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+        # Mint a token; logging in is covered by test_auth_api
+        token = create_access_token(data={"sub": register_response.json()["id"]})
+        auth_headers = {"Authorization": f"Bearer {token}"}
 
         # Step 2: Create initial measurement at ~12% BF
         measurement_data = {
@@ -6,7 +6,7 @@ import pytest
 from decimal import Decimal
 from datetime import date
 
-from fastapi.testclient import TestClient
+from httpx import AsyncClient
 
 from src.api.main import app
 from src.schemas.user import UserResponse
@@ -15,7 +15,7 @@ from src.schemas.user import UserResponse
 class TestUserRegistration:
     """Contract tests for POST /api/v1/users (user registration)."""
 
-    async def test_register_user_success(self, client: TestClient):
+    async def test_register_user_success(self, client: AsyncClient):
         """
         Test successful user registration.
 
@@ -74,7 +74,7 @@ class TestUserRegistration:
         assert data["preferred_calculation_method"] == user_data["preferred_calculation_method"]
         assert data["activity_level"] == user_data["activity_level"]
 
-    async def test_register_user_duplicate_email(self, client: TestClient):
+    async def test_register_user_duplicate_email(self, client: AsyncClient):
         """
         Test user registration fails with duplicate email.
 
@@ -111,7 +111,7 @@ class TestUserRegistration:
         assert "detail" in data
         assert "email" in data["detail"].lower() or "already" in data["detail"].lower()
 
-    async def test_register_user_invalid_email(self, client: TestClient):
+    async def test_register_user_invalid_email(self, client: AsyncClient):
         """
         Test user registration fails with invalid email format.
 
@@ -140,7 +140,7 @@ class TestUserRegistration:
         data = response.json()
         assert "detail" in data
 
-    async def test_register_user_weak_password(self, client: TestClient):
+    async def test_register_user_weak_password(self, client: AsyncClient):
         """
         Test user registration fails with weak password.
 
@@ -168,7 +168,7 @@ class TestUserRegistration:
         data = response.json()
         assert "detail" in data
 
-    async def test_register_user_invalid_height(self, client: TestClient):
+    async def test_register_user_invalid_height(self, client: AsyncClient):
         """
         Test user registration fails with height outside valid range.
 
@@ -194,7 +194,7 @@ class TestUserRegistration:
         # Assert
         assert response.status_code == 422
 
-    async def test_register_user_invalid_age(self, client: TestClient):
+    async def test_register_user_invalid_age(self, client: AsyncClient):
         """
         Test user registration fails with invalid age (under 13).
 
@@ -219,3 +219,43 @@ class TestUserRegistration:
 
         # Assert
         assert response.status_code == 422
+
+    async def test_register_user_age_uses_request_date(
+        self, client: AsyncClient, monkeypatch
+    ):
+        """
+        Test the age check reads the date resolved for the request.
+
+        Validates:
+        - set_request_today dependency feeds the UserCreate validator
+        - Request date is cleared once the request finishes
+        """
+        from src.api import dependencies
+        from src.core.context import request_today
+
+        class FrozenDate(date):
+            @classmethod
+            def today(cls):
+                return date(2000, 1, 1)
+
+        monkeypatch.setattr(dependencies, "date", FrozenDate)
+
+        # Arrange - 36 today, but only 10 on the frozen request date
+        user_data = {
+            "email": "frozen@example.com",
+            "password": "SecurePass123!",
+            "full_name": "Frozen Date",
+            "date_of_birth": "1990-01-01",
+            "gender": "male",
+            "height_cm": 175.0,
+            "preferred_calculation_method": "navy",
+            "activity_level": "moderately_active",
+        }
+
+        # Act
+        response = await client.post("/api/v1/users", json=user_data)
+
+        # Assert
+        assert response.status_code == 422
+        assert "between 13 and 120" in response.text
+        assert request_today.get() is None
@@ -16,9 +16,9 @@ class TestNavyMethod:
         """Test Navy method for adult male."""
         result = BodyFatCalculator.calculate_navy(
             gender=Gender.MALE,
-            height_cm=Decimal("175.0"),
-            waist_cm=Decimal("90.0"),
-            neck_cm=Decimal("38.0"),
+            height_cm=175.0,
+            waist_cm=90.0,
+            neck_cm=38.0,
         )
         # Expected range based on formula (27.25% for these measurements)
         assert 15.0 <= result <= 35.0
@@ -28,10 +28,10 @@ class TestNavyMethod:
         """Test Navy method for adult female."""
         result = BodyFatCalculator.calculate_navy(
             gender=Gender.FEMALE,
-            height_cm=Decimal("165.0"),
-            waist_cm=Decimal("75.0"),
-            neck_cm=Decimal("32.0"),
-            hip_cm=Decimal("95.0"),
+            height_cm=165.0,
+            waist_cm=75.0,
+            neck_cm=32.0,
+            hip_cm=95.0,
         )
         # Expected range based on formula (54.24% for these measurements)
         assert 20.0 <= result <= 60.0
@@ -42,9 +42,9 @@ class TestNavyMethod:
         with pytest.raises(ValueError, match="Hip measurement required"):
             BodyFatCalculator.calculate_navy(
                 gender=Gender.FEMALE,
-                height_cm=Decimal("165.0"),
-                waist_cm=Decimal("75.0"),
-                neck_cm=Decimal("32.0"),
+                height_cm=165.0,
+                waist_cm=75.0,
+                neck_cm=32.0,
             )
 
 
@@ -56,9 +56,9 @@ class TestThreeSiteMethod:
         result = BodyFatCalculator.calculate_3_site(
             gender=Gender.MALE,
             age=30,
-            chest_mm=Decimal("10.0"),
-            abdomen_mm=Decimal("20.0"),
-            thigh_mm=Decimal("15.0"),
+            chest_mm=10.0,
+            abdomen_mm=20.0,
+            thigh_mm=15.0,
         )
         # Expected range for lean male
         assert 8.0 <= result <= 18.0
@@ -69,9 +69,9 @@ class TestThreeSiteMethod:
         result = BodyFatCalculator.calculate_3_site(
             gender=Gender.FEMALE,
             age=28,
-            tricep_mm=Decimal("15.0"),
-            suprailiac_mm=Decimal("12.0"),
-            thigh_mm=Decimal("18.0"),
+            tricep_mm=15.0,
+            suprailiac_mm=12.0,
+            thigh_mm=18.0,
         )
         # Expected range for fit female
         assert 15.0 <= result <= 28.0
@@ -83,7 +83,7 @@ class TestThreeSiteMethod:
             BodyFatCalculator.calculate_3_site(
                 gender=Gender.MALE,
                 age=30,
-                chest_mm=Decimal("10.0"),
+                chest_mm=10.0,
                 # Missing abdomen and thigh
             )
 
@@ -93,7 +93,7 @@ class TestThreeSiteMethod:
             BodyFatCalculator.calculate_3_site(
                 gender=Gender.FEMALE,
                 age=28,
-                tricep_mm=Decimal("15.0"),
+                tricep_mm=15.0,
                 # Missing suprailiac and thigh
             )
 
@@ -106,13 +106,13 @@ class TestSevenSiteMethod:
         result = BodyFatCalculator.calculate_7_site(
             gender=Gender.MALE,
             age=35,
-            chest_mm=Decimal("8.0"),
-            midaxillary_mm=Decimal("10.0"),
-            tricep_mm=Decimal("9.0"),
-            subscapular_mm=Decimal("12.0"),
-            abdomen_mm=Decimal("18.0"),
-            suprailiac_mm=Decimal("11.0"),
-            thigh_mm=Decimal("14.0"),
+            chest_mm=8.0,
+            midaxillary_mm=10.0,
+            tricep_mm=9.0,
+            subscapular_mm=12.0,
+            abdomen_mm=18.0,
+            suprailiac_mm=11.0,
+            thigh_mm=14.0,
         )
         # Expected range for fit male
         assert 10.0 <= result <= 20.0
@@ -123,13 +123,13 @@ class TestSevenSiteMethod:
         result = BodyFatCalculator.calculate_7_site(
             gender=Gender.FEMALE,
             age=32,
-            chest_mm=Decimal("10.0"),
-            midaxillary_mm=Decimal("12.0"),
-            tricep_mm=Decimal("14.0"),
-            subscapular_mm=Decimal("13.0"),
-            abdomen_mm=Decimal("16.0"),
-            suprailiac_mm=Decimal("15.0"),
-            thigh_mm=Decimal("18.0"),
+            chest_mm=10.0,
+            midaxillary_mm=12.0,
+            tricep_mm=14.0,
+            subscapular_mm=13.0,
+            abdomen_mm=16.0,
+            suprailiac_mm=15.0,
+            thigh_mm=18.0,
         )
         # Expected range for fit female
         assert 18.0 <= result <= 30.0
@@ -145,9 +145,9 @@ class TestCalculateMethod:
             method=CalculationMethod.NAVY,
             gender=Gender.MALE,
             age=30,
-            height_cm=Decimal("175.0"),
-            waist_cm=Decimal("90.0"),
-            neck_cm=Decimal("38.0"),
+            height_cm=175.0,
+            waist_cm=90.0,
+            neck_cm=38.0,
         )
         assert 15.0 <= result <= 35.0
 
@@ -157,10 +157,10 @@ class TestCalculateMethod:
             method=CalculationMethod.THREE_SITE,
             gender=Gender.MALE,
             age=30,
-            height_cm=Decimal("175.0"),
-            chest_mm=Decimal("10.0"),
-            abdomen_mm=Decimal("20.0"),
-            thigh_mm=Decimal("15.0"),
+            height_cm=175.0,
+            chest_mm=10.0,
+            abdomen_mm=20.0,
+            thigh_mm=15.0,
         )
         assert 8.0 <= result <= 18.0
 
@@ -170,14 +170,14 @@ class TestCalculateMethod:
             method=CalculationMethod.SEVEN_SITE,
             gender=Gender.MALE,
             age=35,
-            height_cm=Decimal("175.0"),
-            chest_mm=Decimal("8.0"),
-            midaxillary_mm=Decimal("10.0"),
-            tricep_mm=Decimal("9.0"),
-            subscapular_mm=Decimal("12.0"),
-            abdomen_mm=Decimal("18.0"),
-            suprailiac_mm=Decimal("11.0"),
-            thigh_mm=Decimal("14.0"),
+            height_cm=175.0,
+            chest_mm=8.0,
+            midaxillary_mm=10.0,
+            tricep_mm=9.0,
+            subscapular_mm=12.0,
+            abdomen_mm=18.0,
+            suprailiac_mm=11.0,
+            thigh_mm=14.0,
         )
         assert 10.0 <= result <= 20.0
 
@@ -190,9 +190,9 @@ class TestEdgeCases:
         result = BodyFatCalculator.calculate_3_site(
             gender=Gender.MALE,
             age=25,
-            chest_mm=Decimal("5.0"),
-            abdomen_mm=Decimal("8.0"),
-            thigh_mm=Decimal("7.0"),
+            chest_mm=5.0,
+            abdomen_mm=8.0,
+            thigh_mm=7.0,
         )
         # Very lean range
         assert 5.0 <= result <= 12.0
@@ -202,9 +202,9 @@ class TestEdgeCases:
         result = BodyFatCalculator.calculate_3_site(
             gender=Gender.FEMALE,
             age=40,
-            tricep_mm=Decimal("25.0"),
-            suprailiac_mm=Decimal("22.0"),
-            thigh_mm=Decimal("28.0"),
+            tricep_mm=25.0,
+            suprailiac_mm=22.0,
+            thigh_mm=28.0,
         )
         # Higher body fat range
         assert 25.0 <= result <= 40.0
@@ -19,8 +19,8 @@ class TestBMRCalculation:
         # Male: 80kg, 175cm, 30 years
         # BMR = 10*80 + 6.25*175 - 5*30 + 5 = 800 + 1093.75 - 150 + 5 = 1748.75
         bmr = service.calculate_bmr(
-            weight_kg=Decimal("80.0"),
-            height_cm=Decimal("175.0"),
+            weight_kg=80.0,
+            height_cm=175.0,
             age_years=30,
             gender=Gender.MALE,
         )
@@ -35,8 +35,8 @@ class TestBMRCalculation:
         # Female: 65kg, 165cm, 28 years
         # BMR = 10*65 + 6.25*165 - 5*28 - 161 = 650 + 1031.25 - 140 - 161 = 1380.25
         bmr = service.calculate_bmr(
-            weight_kg=Decimal("65.0"),
-            height_cm=Decimal("165.0"),
+            weight_kg=65.0,
+            height_cm=165.0,
             age_years=28,
             gender=Gender.FEMALE,
         )
@@ -48,15 +48,15 @@ class TestBMRCalculation:
         service = GoalService()
         
         male_bmr = service.calculate_bmr(
-            weight_kg=Decimal("70.0"),
-            height_cm=Decimal("170.0"),
+            weight_kg=70.0,
+            height_cm=170.0,
             age_years=25,
             gender=Gender.MALE,
         )
         
         female_bmr = service.calculate_bmr(
-            weight_kg=Decimal("70.0"),
-            height_cm=Decimal("170.0"),
+            weight_kg=70.0,
+            height_cm=170.0,
             age_years=25,
             gender=Gender.FEMALE,
         )
@@ -154,8 +154,8 @@ class TestTimelineEstimation:
         # 22.5% -> 15% = 7.5% difference
         # At 0.75%/month = 10 months = ~43 weeks
         weeks = service.estimate_cutting_timeline(
-            current_bf=Decimal("22.5"),
-            target_bf=Decimal("15.0"),
+            current_bf=22.5,
+            target_bf=15.0,
         )
         assert 40 <= weeks <= 45
     
@@ -165,8 +165,8 @@ class TestTimelineEstimation:
         # 20% -> 15% = 5% difference
         # At 1.0%/month = 5 months = ~22 weeks
         weeks = service.estimate_cutting_timeline(
-            current_bf=Decimal("20.0"),
-            target_bf=Decimal("15.0"),
+            current_bf=20.0,
+            target_bf=15.0,
             rate_per_month=1.0,
         )
         assert 20 <= weeks <= 25
@@ -177,8 +177,8 @@ class TestTimelineEstimation:
         # 12% -> 18% = 6% difference
         # At 0.2%/month = 30 months = ~130 weeks
         weeks = service.estimate_bulking_timeline(
-            current_bf=Decimal("12.0"),
-            ceiling_bf=Decimal("18.0"),
+            current_bf=12.0,
+            ceiling_bf=18.0,
         )
         assert 125 <= weeks <= 135
     
@@ -188,8 +188,8 @@ class TestTimelineEstimation:
         # 10% -> 15% = 5% difference
         # At 0.3%/month = 16.67 months = ~72 weeks
         weeks = service.estimate_bulking_timeline(
-            current_bf=Decimal("10.0"),
-            ceiling_bf=Decimal("15.0"),
+            current_bf=10.0,
+            ceiling_bf=15.0,
             rate_per_month=0.3,
         )
         assert 70 <= weeks <= 75
@@ -15,6 +15,7 @@ from src.models.user import User
 from src.models.measurement import BodyMeasurement
 from src.models.goal import Goal
 from src.schemas.goal import GoalCreate
+from tests.conftest import make_user
 
 
 class TestBMRCalculation:
@@ -27,8 +28,8 @@ class TestBMRCalculation:
         # Male: 80kg, 175cm, 30 years old
         # BMR = 10 × 80 + 6.25 × 175 - 5 × 30 + 5 = 1748.75 ≈ 1749
         bmr = service.calculate_bmr(
-            weight_kg=Decimal("80.0"),
-            height_cm=Decimal("175.0"),
+            weight_kg=80.0,
+            height_cm=175.0,
             age_years=30,
             gender=Gender.MALE,
         )
@@ -43,8 +44,8 @@ class TestBMRCalculation:
         # Female: 65kg, 165cm, 28 years old
         # BMR = 10 × 65 + 6.25 × 165 - 5 × 28 - 161 = 1380.25 ≈ 1380
         bmr = service.calculate_bmr(
-            weight_kg=Decimal("65.0"),
-            height_cm=Decimal("165.0"),
+            weight_kg=65.0,
+            height_cm=165.0,
             age_years=28,
             gender=Gender.FEMALE,
         )
@@ -57,15 +58,15 @@ class TestBMRCalculation:
         service = GoalService()
         
         male_bmr = service.calculate_bmr(
-            weight_kg=Decimal("70.0"),
-            height_cm=Decimal("170.0"),
+            weight_kg=70.0,
+            height_cm=170.0,
             age_years=25,
             gender=Gender.MALE,
         )
         
         female_bmr = service.calculate_bmr(
-            weight_kg=Decimal("70.0"),
-            height_cm=Decimal("170.0"),
+            weight_kg=70.0,
+            height_cm=170.0,
             age_years=25,
             gender=Gender.FEMALE,
         )
@@ -204,8 +205,8 @@ class TestCuttingTimeline:
         # From 22.5% to 15% = 7.5% difference
         # At 0.75% per month = 10 months = 43.3 weeks
         weeks = service.estimate_cutting_timeline(
-            current_bf=Decimal("22.5"),
-            target_bf=Decimal("15.0"),
+            current_bf=22.5,
+            target_bf=15.0,
         )
         
         assert isinstance(weeks, int)
@@ -218,8 +219,8 @@ class TestCuttingTimeline:
         # From 20% to 15% = 5% difference
         # At 1.0% per month = 5 months = 21.65 weeks
         weeks = service.estimate_cutting_timeline(
-            current_bf=Decimal("20.0"),
-            target_bf=Decimal("15.0"),
+            current_bf=20.0,
+            target_bf=15.0,
             rate_per_month=1.0,
         )
         
@@ -232,8 +233,8 @@ class TestCuttingTimeline:
         # From 25% to 20% = 5% difference
         # At 0.5% per month = 10 months = 43.3 weeks
         weeks = service.estimate_cutting_timeline(
-            current_bf=Decimal("25.0"),
-            target_bf=Decimal("20.0"),
+            current_bf=25.0,
+            target_bf=20.0,
             rate_per_month=0.5,
         )
         
@@ -250,8 +251,8 @@ class TestBulkingTimeline:
         # From 12% to 18% = 6% difference
         # At 0.2% per month = 30 months = 130 weeks
         weeks = service.estimate_bulking_timeline(
-            current_bf=Decimal("12.0"),
-            ceiling_bf=Decimal("18.0"),
+            current_bf=12.0,
+            ceiling_bf=18.0,
         )
         
         assert isinstance(weeks, int)
@@ -264,8 +265,8 @@ class TestBulkingTimeline:
         # From 10% to 15% = 5% difference
         # At 0.3% per month = 16.67 months = 72 weeks
         weeks = service.estimate_bulking_timeline(
-            current_bf=Decimal("10.0"),
-            ceiling_bf=Decimal("15.0"),
+            current_bf=10.0,
+            ceiling_bf=15.0,
             rate_per_month=0.3,
         )
         
@@ -535,3 +536,135 @@ class TestActiveGoalCheck:
         has_active = await service.check_active_goal_exists(db_session, user.id)
         
         assert has_active is False
+
+    def test_active_goal_index_matches_stored_status(self):
+        """Test the partial index predicate uses the label goals store."""
+        index = next(
+            i for i in Goal.__table__.indexes if i.name == "ix_goals_user_active"
+        )
+
+        where = str(index.dialect_options["postgresql"]["where"])
+
+        assert where == f"status = '{GoalStatus.ACTIVE.value}'"
+
+
+class TestGoalCompletion:
+    """Test completing goals once the body fat target is reached."""
+
+    @pytest.mark.asyncio
+    async def test_cutting_goal_completes_at_target(self, db_session: AsyncSession):
+        """Test cutting goal completes only once current BF <= target BF."""
+        user = make_user("complete@example.com", full_name="Complete User")
+        db_session.add(user)
+        await db_session.flush()
+
+        measurement = BodyMeasurement(
+            user_id=user.id,
+            weight_kg=Decimal("80.0"),
+            calculation_method=CalculationMethod.NAVY,
+            waist_cm=Decimal("90.0"),
+            neck_cm=Decimal("38.0"),
+            hip_cm=None,
+            calculated_body_fat_percentage=Decimal("20.0"),
+            measured_at=datetime.utcnow(),
+            created_at=datetime.utcnow(),
+        )
+        db_session.add(measurement)
+        await db_session.flush()
+
+        goal = Goal(
+            user_id=user.id,
+            goal_type=GoalType.CUTTING,
+            status=GoalStatus.ACTIVE,
+            initial_measurement_id=measurement.id,
+            initial_body_fat_percentage=Decimal("20.0"),
+            target_body_fat_percentage=Decimal("15.0"),
+            initial_weight_kg=Decimal("80.0"),
+            target_calories=2200,
+            estimated_weeks_to_goal=30,
+            started_at=datetime.utcnow(),
+            created_at=datetime.utcnow(),
+            updated_at=datetime.utcnow(),
+        )
+        db_session.add(goal)
+        await db_session.commit()
+        goal_id = goal.id
+
+        service = GoalService()
+
+        assert await service.check_goal_completion(
+            db_session, goal_id, Decimal("15.1")
+        ) is False
+        assert await service.check_goal_completion(
+            db_session, goal_id, Decimal("15.0")
+        ) is True
+        # Already completed goals are left alone
+        assert await service.check_goal_completion(
+            db_session, goal_id, Decimal("14.0")
+        ) is False
+
+        db_session.expire_all()
+        completed = await db_session.get(Goal, goal_id)
+        assert completed.status == GoalStatus.COMPLETED
+        assert completed.completed_at is not None
+
+
+class TestCreateGoal:
+    """Test values derived when creating a goal."""
+
+    @pytest.mark.asyncio
+    async def test_age_is_whole_years_before_birthday(
+        self, db_session: AsyncSession, monkeypatch
+    ):
+        """Test age stays 35 the day before a 36th birthday.
+
+        13148 days have passed, which a days // 365 age would round up to 36.
+        """
+        from src.services import goal_service
+
+        class FrozenDateTime(datetime):
+            @classmethod
+            def utcnow(cls):
+                return datetime(2026, 10, 16, 12, 0)
+
+        monkeypatch.setattr(goal_service, "datetime", FrozenDateTime)
+
+        user = make_user(
+            "birthday@example.com",
+            full_name="Birthday User",
+            date_of_birth=date(1990, 10, 17),
+        )
+        db_session.add(user)
+        await db_session.flush()
+
+        measurement = BodyMeasurement(
+            user_id=user.id,
+            weight_kg=Decimal("80.0"),
+            calculation_method=CalculationMethod.NAVY,
+            waist_cm=Decimal("90.0"),
+            neck_cm=Decimal("38.0"),
+            hip_cm=None,
+            calculated_body_fat_percentage=Decimal("20.0"),
+            measured_at=datetime.utcnow(),
+            created_at=datetime.utcnow(),
+        )
+        db_session.add(measurement)
+        await db_session.commit()
+
+        goal = await GoalService().create_goal(
+            db_session,
+            user.id,
+            GoalCreate(
+                goal_type=GoalType.CUTTING,
+                initial_measurement_id=measurement.id,
+                target_body_fat_percentage=Decimal("15.0"),
+            ),
+        )
+
+        bmr = GoalService.calculate_bmr(80.0, 175.0, 35, Gender.MALE)
+        tdee = GoalService.calculate_tdee(bmr, ActivityLevel.MODERATELY_ACTIVE)
+        assert goal.target_calories == GoalService.calculate_cutting_calories(
+            tdee, Gender.MALE
+        )
+        assert goal.bmr_at_creation == bmr
+        assert goal.tdee_at_creation == tdee
@@ -0,0 +1,102 @@
+"""
+Unit tests for custom SQLAlchemy column types.
+"""
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import select, update
+from sqlalchemy.dialects import postgresql
+
+from src.models.enums import ActivityLevel, Gender
+from src.models.plan import TrainingPlan
+from src.models.types import SmallIntEnum
+from src.models.user import User
+from tests.conftest import make_user
+
+
+class TestSmallIntEnum:
+    """Test enum <-> SMALLINT code conversion."""
+
+    dialect = postgresql.dialect()
+
+    def test_bind_uses_declaration_order(self):
+        """Test members are stored as their declaration index."""
+        column_type = SmallIntEnum(ActivityLevel)
+        assert column_type.process_bind_param(
+            ActivityLevel.SEDENTARY, self.dialect
+        ) == 0
+        assert column_type.process_bind_param(
+            ActivityLevel.EXTREMELY_ACTIVE, self.dialect
+        ) == 4
+
+    def test_bind_accepts_raw_value(self):
+        """Test plain string values are coerced through the enum."""
+        column_type = SmallIntEnum(Gender)
+        assert column_type.process_bind_param("female", self.dialect) == 1
+
+    def test_round_trip(self):
+        """Test every member survives bind and result conversion."""
+        column_type = SmallIntEnum(Gender)
+        for member in Gender:
+            code = column_type.process_bind_param(member, self.dialect)
+            assert column_type.process_result_value(code, self.dialect) is member
+
+    def test_none_passthrough(self):
+        """Test NULL values are left untouched."""
+        column_type = SmallIntEnum(Gender)
+        assert column_type.process_bind_param(None, self.dialect) is None
+        assert column_type.process_result_value(None, self.dialect) is None
+
+
+class TestUpdatedAtTrigger:
+    """Test updated_at is maintained by the set_updated_at() trigger."""
+
+    async def test_bulk_update_bumps_updated_at(self, db_session):
+        """Test a Core UPDATE (no ORM onupdate) still refreshes updated_at."""
+        # Tests share one rolled-back transaction, where now() is fixed,
+        # so start from an older timestamp set on INSERT
+        user = make_user(
+            "trigger@example.com",
+            full_name="Trigger User",
+            updated_at=datetime(2020, 1, 1),
+        )
+        db_session.add(user)
+        await db_session.commit()
+        user_id = user.id
+        stmt = select(User.updated_at).where(User.id == user_id)
+        before = (await db_session.execute(stmt)).scalar_one()
+
+        await db_session.execute(
+            update(User).where(User.id == user_id).values(full_name="Renamed")
+        )
+        await db_session.commit()
+
+        after = (await db_session.execute(stmt)).scalar_one()
+        assert after > before
+
+
+class TestCardioFrequencyColumn:
+    """Test the generated training_plans.cardio_frequency column."""
+
+    async def test_generated_from_plan_details(self, db_session, test_goal):
+        """Test cardio frequency is extracted from the JSONB plan."""
+        from src.services.plan_generator import PlanGenerator
+
+        plan_details = PlanGenerator()._generate_cutting_training_plan()
+        db_session.add(
+            TrainingPlan(
+                goal_id=UUID(test_goal["id"]),
+                plan_details=plan_details,
+                workout_frequency=5,
+                primary_focus="Fat loss",
+            )
+        )
+        await db_session.commit()
+
+        result = await db_session.execute(
+            select(TrainingPlan.goal_id).where(
+                TrainingPlan.cardio_frequency
+                == plan_details["cardio"]["frequency"]
+            )
+        )
+        assert result.scalar_one() == UUID(test_goal["id"])
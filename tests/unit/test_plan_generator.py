@@ -151,6 +151,44 @@ class TestMacroCalculations:
         # Total close to 4000
         assert abs(macros.total_calories - 4000) <= 100
 
+    def test_macro_percentages_round_half_up(self):
+        """Test percentages are rounded to one decimal, ties rounding up.
+
+        77.5kg bulking at 1600 kcal gives 620 kcal protein (38.75%),
+        432 kcal fat (27%) and 548 kcal carbs (34.25%).
+        """
+        plan_generator = PlanGenerator()
+
+        macros = plan_generator.calculate_macros(
+            calories=1600, goal_type=GoalType.BULKING, weight_kg=77.5
+        )
+
+        assert macros.total_calories == 1600
+        assert macros.protein_percentage == 38.8
+        assert macros.fat_percentage == 27.0
+        assert macros.carbs_percentage == 34.3
+
+    def test_macros_carbs_clamped_to_zero(self):
+        """Test carbs floor at 0g when protein and fat exceed the calories.
+
+        120kg cutting at 1200 kcal needs 1152 kcal protein and 264 kcal fat,
+        leaving -216 kcal for carbs. Carbs are clamped to 0, so the actual
+        total (1413 kcal) exceeds the target and percentages use the actual.
+        """
+        plan_generator = PlanGenerator()
+
+        macros = plan_generator.calculate_macros(
+            calories=1200, goal_type=GoalType.CUTTING, weight_kg=120.0
+        )
+
+        assert macros.protein_grams == 288
+        assert macros.carbs_grams == 0
+        assert macros.fat_grams == 29
+        assert macros.total_calories == 1413
+        assert macros.protein_percentage == 81.5
+        assert macros.fat_percentage == 18.5
+        assert macros.carbs_percentage == 0.0
+
 
 class TestTrainingPlanGeneration:
     """Test training plan generation for different goal types."""
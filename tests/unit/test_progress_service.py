@@ -17,6 +17,7 @@ from src.models.measurement import BodyMeasurement
 from src.models.progress import ProgressEntry
 from src.schemas.progress import TrendsResponse
 from src.services.progress_service import ProgressService
+from tests.conftest import make_user
 
 
 class TestCalculateProgressPercentage:
@@ -194,6 +195,28 @@ class TestCalculateProgressPercentage:
         assert progress == Decimal("0.0")
 
 
+def _mock_trends_queries(db, goal, progress_entries):
+    """Mock the goal, aggregate and recent-entry queries run by get_trends."""
+    goal_result = MagicMock()
+    goal_result.scalar_one_or_none.return_value = goal
+
+    weeks = len(progress_entries)
+    totals_result = MagicMock()
+    totals_result.one.return_value = (
+        sum(e.body_fat_change for e in progress_entries) / weeks,
+        sum(e.weight_change_kg for e in progress_entries) / weeks,
+        sum(e.is_on_track for e in progress_entries),
+        weeks,
+    )
+
+    recent_result = MagicMock()
+    recent_result.scalars.return_value.all.return_value = sorted(
+        progress_entries, key=lambda e: e.week_number, reverse=True
+    )[:3]
+
+    db.execute.side_effect = [goal_result, totals_result, recent_result]
+
+
 class TestGetTrends:
     """Test trend analysis (T051)."""
 
@@ -231,11 +254,8 @@ class TestGetTrends:
         goal.goal_type = GoalType.CUTTING
         goal.target_body_fat_percentage = Decimal("15.0")
         goal.initial_measurement = initial_measurement
-        goal.progress_entries = progress_entries
 
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = goal
-        db.execute.return_value = mock_result
+        _mock_trends_queries(db, goal, progress_entries)
 
         trends = await service.get_trends(goal_id)
 
@@ -280,11 +300,8 @@ class TestGetTrends:
         goal.goal_type = GoalType.CUTTING
         goal.target_body_fat_percentage = Decimal("15.0")
         goal.initial_measurement = initial_measurement
-        goal.progress_entries = progress_entries
 
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = goal
-        db.execute.return_value = mock_result
+        _mock_trends_queries(db, goal, progress_entries)
 
         trends = await service.get_trends(goal_id)
 
@@ -339,11 +356,8 @@ class TestGetTrends:
         goal.goal_type = GoalType.CUTTING
         goal.target_body_fat_percentage = Decimal("15.0")
         goal.initial_measurement = initial_measurement
-        goal.progress_entries = progress_entries
 
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = goal
-        db.execute.return_value = mock_result
+        _mock_trends_queries(db, goal, progress_entries)
 
         trends = await service.get_trends(goal_id)
 
@@ -387,11 +401,8 @@ class TestGetTrends:
         goal.goal_type = GoalType.CUTTING
         goal.target_body_fat_percentage = Decimal("15.0")
         goal.initial_measurement = initial_measurement
-        goal.progress_entries = progress_entries
 
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = goal
-        db.execute.return_value = mock_result
+        _mock_trends_queries(db, goal, progress_entries)
 
         trends = await service.get_trends(goal_id)
 
@@ -438,11 +449,8 @@ class TestSuggestAdjustments:
         goal.goal_type = GoalType.CUTTING
         goal.target_body_fat_percentage = Decimal("15.0")
         goal.initial_measurement = initial_measurement
-        goal.progress_entries = progress_entries
 
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = goal
-        db.execute.return_value = mock_result
+        _mock_trends_queries(db, goal, progress_entries)
 
         trends = await service.get_trends(goal_id)
 
@@ -485,11 +493,8 @@ class TestSuggestAdjustments:
         goal.goal_type = GoalType.CUTTING
         goal.target_body_fat_percentage = Decimal("15.0")
         goal.initial_measurement = initial_measurement
-        goal.progress_entries = progress_entries
 
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = goal
-        db.execute.return_value = mock_result
+        _mock_trends_queries(db, goal, progress_entries)
 
         trends = await service.get_trends(goal_id)
 
@@ -533,11 +538,8 @@ class TestSuggestAdjustments:
         goal.goal_type = GoalType.CUTTING
         goal.target_body_fat_percentage = Decimal("15.0")
         goal.initial_measurement = initial_measurement
-        goal.progress_entries = progress_entries
 
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = goal
-        db.execute.return_value = mock_result
+        _mock_trends_queries(db, goal, progress_entries)
 
         trends = await service.get_trends(goal_id)
 
@@ -582,11 +584,8 @@ class TestSuggestAdjustments:
         goal.goal_type = GoalType.CUTTING
         goal.target_body_fat_percentage = Decimal("15.0")
         goal.initial_measurement = initial_measurement
-        goal.progress_entries = progress_entries
 
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = goal
-        db.execute.return_value = mock_result
+        _mock_trends_queries(db, goal, progress_entries)
 
         trends = await service.get_trends(goal_id)
 
@@ -600,11 +599,54 @@ class TestSuggestAdjustments:
                    ["deficit", "increase", "calories", "cardio"])
 
 
+class TestFloatThresholds:
+    """Test float analysis keeps exact two-decimal boundaries."""
+
+    def test_on_track_at_exact_minimum_loss(self):
+        """1.20% lost over 3 weeks is exactly 0.4%/week: on track."""
+        service = ProgressService(AsyncMock())
+        goal = MagicMock(spec=Goal)
+        goal.goal_type = GoalType.CUTTING
+
+        assert service._calculate_on_track_status(
+            goal=goal, body_fat_change=Decimal("-1.20"), weeks_elapsed=3
+        ) is True
+
+    def test_weeks_remaining_exact_quotient(self):
+        """0.02% left at 0.01%/week is 2 weeks, not 1 (15.02 - 15 < 0.02)."""
+        service = ProgressService(AsyncMock())
+        goal = MagicMock(spec=Goal)
+        goal.goal_type = GoalType.CUTTING
+        goal.target_body_fat_percentage = Decimal("15.00")
+
+        weeks = service._estimate_weeks_remaining(
+            goal=goal,
+            current_bf=15.02,
+            weekly_bf_change_avg=-0.01,
+        )
+
+        assert weeks == 2
+
+    def test_zero_average_change_has_no_estimate(self):
+        """Changes that cancel out give no estimate despite float residue."""
+        service = ProgressService(AsyncMock())
+        goal = MagicMock(spec=Goal)
+        goal.goal_type = GoalType.CUTTING
+        goal.target_body_fat_percentage = Decimal("15.00")
+
+        weeks = service._estimate_weeks_remaining(
+            goal=goal,
+            current_bf=20.0,
+            weekly_bf_change_avg=(-0.91 - 0.74 + 0.89 + 0.58 + 0.08 + 0.1) / 6,
+        )
+
+        assert weeks is None
+
+
 class TestCheckBulkingCeiling:
     """Test bulking ceiling checks (T071)."""
 
-    @pytest.mark.asyncio
-    async def test_check_bulking_ceiling_within_safe_range(self):
+    def test_check_bulking_ceiling_within_safe_range(self):
         """Test ceiling check when well below ceiling (no warning).
 
         Test Case: Current BF 14%, ceiling 18% (4% remaining)
@@ -618,7 +660,7 @@ class TestCheckBulkingCeiling:
         goal.goal_type = GoalType.BULKING
         goal.ceiling_body_fat_percentage = Decimal("18.0")
 
-        warning, should_complete = await service.check_bulking_ceiling(
+        warning, should_complete = service.check_bulking_ceiling(
             current_bf=Decimal("14.0"),
             ceiling_bf=Decimal("18.0"),
             goal=goal
@@ -627,8 +669,7 @@ class TestCheckBulkingCeiling:
         assert warning is None
         assert should_complete is False
 
-    @pytest.mark.asyncio
-    async def test_check_bulking_ceiling_within_one_percent(self):
+    def test_check_bulking_ceiling_within_one_percent(self):
         """Test ceiling check when within 1% of ceiling (warning).
 
         Test Case: Current BF 17.2%, ceiling 18% (0.8% remaining)
@@ -642,7 +683,7 @@ class TestCheckBulkingCeiling:
         goal.goal_type = GoalType.BULKING
         goal.ceiling_body_fat_percentage = Decimal("18.0")
 
-        warning, should_complete = await service.check_bulking_ceiling(
+        warning, should_complete = service.check_bulking_ceiling(
             current_bf=Decimal("17.2"),
             ceiling_bf=Decimal("18.0"),
             goal=goal
@@ -653,8 +694,7 @@ class TestCheckBulkingCeiling:
         assert "0.8%" in warning
         assert should_complete is False
 
-    @pytest.mark.asyncio
-    async def test_check_bulking_ceiling_at_ceiling(self):
+    def test_check_bulking_ceiling_at_ceiling(self):
         """Test ceiling check when exactly at ceiling (complete goal).
 
         Test Case: Current BF 18.0%, ceiling 18.0% (0% remaining)
@@ -668,7 +708,7 @@ class TestCheckBulkingCeiling:
         goal.goal_type = GoalType.BULKING
         goal.ceiling_body_fat_percentage = Decimal("18.0")
 
-        warning, should_complete = await service.check_bulking_ceiling(
+        warning, should_complete = service.check_bulking_ceiling(
             current_bf=Decimal("18.0"),
             ceiling_bf=Decimal("18.0"),
             goal=goal
@@ -679,8 +719,7 @@ class TestCheckBulkingCeiling:
         assert "complete" in warning.lower()
         assert should_complete is True
 
-    @pytest.mark.asyncio
-    async def test_check_bulking_ceiling_above_ceiling(self):
+    def test_check_bulking_ceiling_above_ceiling(self):
         """Test ceiling check when above ceiling (complete goal).
 
         Test Case: Current BF 18.5%, ceiling 18.0% (-0.5% remaining)
@@ -694,7 +733,7 @@ class TestCheckBulkingCeiling:
         goal.goal_type = GoalType.BULKING
         goal.ceiling_body_fat_percentage = Decimal("18.0")
 
-        warning, should_complete = await service.check_bulking_ceiling(
+        warning, should_complete = service.check_bulking_ceiling(
             current_bf=Decimal("18.5"),
             ceiling_bf=Decimal("18.0"),
             goal=goal
@@ -708,8 +747,7 @@ class TestCheckBulkingCeiling:
 class TestCheckBulkingRate:
     """Test bulking rate checks (T072)."""
 
-    @pytest.mark.asyncio
-    async def test_check_bulking_rate_healthy_rate(self):
+    def test_check_bulking_rate_healthy_rate(self):
         """Test rate check with healthy gain rate (no warning).
 
         Test Case: 0.3%/week gain (within 0.1-0.3% ideal range)
@@ -719,7 +757,7 @@ class TestCheckBulkingRate:
         db = AsyncMock()
         service = ProgressService(db)
 
-        warning = await service.check_bulking_rate(
+        warning = service.check_bulking_rate(
             previous_bf=Decimal("14.0"),
             current_bf=Decimal("14.3"),
             weeks=1
@@ -727,8 +765,7 @@ class TestCheckBulkingRate:
 
         assert warning is None
 
-    @pytest.mark.asyncio
-    async def test_check_bulking_rate_too_fast(self):
+    def test_check_bulking_rate_too_fast(self):
         """Test rate check with excessive gain rate (warning).
 
         Test Case: 0.8%/week gain (exceeds 0.5%/week threshold)
@@ -738,7 +775,7 @@ class TestCheckBulkingRate:
         db = AsyncMock()
         service = ProgressService(db)
 
-        warning = await service.check_bulking_rate(
+        warning = service.check_bulking_rate(
             previous_bf=Decimal("14.0"),
             current_bf=Decimal("14.8"),
             weeks=1
@@ -749,3 +786,190 @@ class TestCheckBulkingRate:
         assert "0.8" in warning or "0.80" in warning
         assert "reducing" in warning.lower() or "reduce" in warning.lower()
         assert "surplus" in warning.lower()
+
+
+class TestProgressPersistence:
+    """Test progress entry writes against the database."""
+
+    async def _seed_goal(self, db_session) -> Goal:
+        """Create a cutting goal with two weekly progress entries."""
+        from src.models.enums import CalculationMethod, GoalStatus
+
+        user = make_user("progress@example.com", full_name="Progress User")
+        db_session.add(user)
+        await db_session.flush()
+
+        measurements = [
+            BodyMeasurement(
+                user_id=user.id,
+                weight_kg=weight,
+                calculation_method=CalculationMethod.NAVY,
+                waist_cm=Decimal("90.0"),
+                neck_cm=Decimal("38.0"),
+                calculated_body_fat_percentage=bf,
+                measured_at=datetime(2025, 1, 1) + timedelta(weeks=week),
+                created_at=datetime.utcnow(),
+            )
+            for week, (bf, weight) in enumerate([
+                (Decimal("25.0"), Decimal("90.0")),
+                (Decimal("24.5"), Decimal("89.0")),
+                (Decimal("23.75"), Decimal("88.5")),
+            ])
+        ]
+        db_session.add_all(measurements)
+        await db_session.flush()
+
+        goal = Goal(
+            user_id=user.id,
+            goal_type=GoalType.CUTTING,
+            status=GoalStatus.ACTIVE,
+            initial_measurement_id=measurements[0].id,
+            initial_body_fat_percentage=Decimal("25.0"),
+            target_body_fat_percentage=Decimal("15.0"),
+            initial_weight_kg=Decimal("90.0"),
+            target_calories=2200,
+            estimated_weeks_to_goal=40,
+        )
+        db_session.add(goal)
+        await db_session.flush()
+
+        db_session.add_all([
+            ProgressEntry(
+                goal_id=goal.id,
+                measurement_id=measurement.id,
+                week_number=week,
+                body_fat_percentage=measurement.calculated_body_fat_percentage,
+                weight_kg=measurement.weight_kg,
+                body_fat_change=(
+                    measurement.calculated_body_fat_percentage
+                    - previous.calculated_body_fat_percentage
+                ),
+                weight_change_kg=measurement.weight_kg - previous.weight_kg,
+                is_on_track=True,
+            )
+            for week, (previous, measurement) in enumerate(
+                zip(measurements, measurements[1:]), start=1
+            )
+        ])
+        await db_session.commit()
+        return goal
+
+    @pytest.mark.asyncio
+    async def test_log_progress_rejects_already_logged_week(self, db_session):
+        """A week that already has an entry is rejected by the INSERT."""
+        from sqlalchemy import func, select, update
+
+        from src.models.enums import CalculationMethod
+
+        goal = await self._seed_goal(db_session)
+        # Leave a gap so the next computed week (3) is already taken, as
+        # happens when two submissions for the same week race
+        await db_session.execute(
+            update(ProgressEntry)
+            .where(ProgressEntry.goal_id == goal.id)
+            .where(ProgressEntry.week_number == 2)
+            .values(week_number=3)
+        )
+        measurement = BodyMeasurement(
+            user_id=goal.user_id,
+            weight_kg=Decimal("88.0"),
+            calculation_method=CalculationMethod.NAVY,
+            waist_cm=Decimal("89.0"),
+            neck_cm=Decimal("38.0"),
+            calculated_body_fat_percentage=Decimal("23.0"),
+            measured_at=datetime(2025, 1, 22),
+            created_at=datetime.utcnow(),
+        )
+        db_session.add(measurement)
+        await db_session.commit()
+
+        service = ProgressService(db_session)
+
+        with pytest.raises(ValueError, match="week 3 has already been logged"):
+            await service.log_progress(goal.id, measurement.id)
+
+        count = await db_session.scalar(
+            select(func.count()).where(ProgressEntry.goal_id == goal.id)
+        )
+        assert count == 2
+
+    @pytest.mark.asyncio
+    async def test_log_progress_query_count(self, db_session):
+        """log_progress loads everything it needs up front, no lazy loads."""
+        from sqlalchemy import event
+
+        from src.models.enums import CalculationMethod
+
+        goal = await self._seed_goal(db_session)
+        measurement = BodyMeasurement(
+            user_id=goal.user_id,
+            weight_kg=Decimal("88.0"),
+            calculation_method=CalculationMethod.NAVY,
+            waist_cm=Decimal("89.0"),
+            neck_cm=Decimal("38.0"),
+            calculated_body_fat_percentage=Decimal("23.0"),
+            measured_at=datetime(2025, 1, 22),
+            created_at=datetime.utcnow(),
+        )
+        db_session.add(measurement)
+        await db_session.commit()
+        db_session.expunge_all()
+
+        statements = []
+
+        def count(conn, cursor, statement, parameters, context, executemany):
+            # The test session wraps commits in savepoints; skip those
+            if not statement.startswith(("SAVEPOINT", "RELEASE SAVEPOINT")):
+                statements.append(statement)
+
+        engine = db_session.bind.sync_engine
+        event.listen(engine, "before_cursor_execute", count)
+        try:
+            entry = await ProgressService(db_session).log_progress(
+                goal.id, measurement.id
+            )
+        finally:
+            event.remove(engine, "before_cursor_execute", count)
+
+        assert entry.week_number == 3
+        # Goal + new measurement + entry count, the initial measurement
+        # selectin load, the previous measurement and the INSERT ... RETURNING
+        assert len(statements) == 4
+
+    @pytest.mark.asyncio
+    async def test_get_trends_aggregates_in_database(self, db_session):
+        """get_trends averages and counts entries with SQL aggregates."""
+        from sqlalchemy import update
+
+        goal = await self._seed_goal(db_session)
+        await db_session.execute(
+            update(ProgressEntry)
+            .where(ProgressEntry.goal_id == goal.id)
+            .where(ProgressEntry.week_number == 2)
+            .values(is_on_track=False)
+        )
+        await db_session.commit()
+
+        trends = await ProgressService(db_session).get_trends(goal.id)
+
+        assert trends.weeks_elapsed == 2
+        assert trends.weekly_bf_change_avg == pytest.approx(-0.625)
+        assert trends.weekly_weight_change_avg == pytest.approx(-0.75)
+        # One of two weeks on track is below the 60% threshold
+        assert trends.is_on_track is False
+        assert trends.trend == "insufficient_data"
+        # (25.0 - 23.75) / (25.0 - 15.0) from the latest entry
+        assert trends.progress_percentage == pytest.approx(12.5)
+
+    @pytest.mark.asyncio
+    async def test_calculate_progress_uses_latest_week(self, db_session):
+        """Entries load ordered by week, so the last one is the latest."""
+        goal = await self._seed_goal(db_session)
+        db_session.expunge_all()
+
+        progress = await ProgressService(db_session).calculate_progress_percentage(
+            goal.id
+        )
+
+        # (25.0 - 23.75) / (25.0 - 15.0) from week 2, not week 1's 24.5
+        assert progress == pytest.approx(12.5)
@@ -9,6 +9,7 @@ from datetime import timedelta
 import pytest
 from jose import JWTError, jwt
 
+from src.core import security
 from src.core.config import settings
 from src.core.security import (
     create_access_token,
@@ -17,11 +18,17 @@ from src.core.security import (
     get_password_hash,
     verify_password,
 )
+from tests.conftest import PRODUCTION_PWD_CONTEXT
 
 
 class TestPasswordHashing:
     """Test password hashing and verification with bcrypt."""
 
+    @pytest.fixture(autouse=True)
+    def production_pwd_context(self, monkeypatch):
+        """Hash with the production context instead of the fast test one."""
+        monkeypatch.setattr(security, "pwd_context", PRODUCTION_PWD_CONTEXT)
+
     def test_hash_password(self):
         """Test that password hashing produces a bcrypt hash."""
         password = "SecurePassword123!"
@@ -0,0 +1,88 @@
+"""
+Unit tests for user schema validation.
+
+Tests the date_of_birth age bounds (13-120 years) at their edges.
+"""
+from datetime import date
+
+import pytest
+from pydantic import ValidationError
+
+from src.core.context import request_today
+from src.models.enums import ActivityLevel, CalculationMethod, Gender
+from src.schemas.user import UserCreate, UserUpdate
+
+
+@pytest.fixture
+def today():
+    """Pin the date the age validators treat as today."""
+    def _set(day: date) -> date:
+        tokens.append(request_today.set(day))
+        return day
+
+    tokens = []
+    yield _set
+    for token in reversed(tokens):
+        request_today.reset(token)
+
+
+class TestAgeBounds:
+    """Test the 13-120 year age window on date_of_birth."""
+
+    def test_thirteenth_birthday_is_accepted(self, today):
+        """Test a user turning 13 today is old enough."""
+        today(date(2026, 10, 16))
+
+        user = UserUpdate(date_of_birth=date(2013, 10, 16))
+
+        assert user.date_of_birth == date(2013, 10, 16)
+
+    def test_day_before_thirteenth_birthday_is_rejected(self, today):
+        """Test a user turning 13 tomorrow is still too young."""
+        today(date(2026, 10, 16))
+
+        with pytest.raises(ValidationError, match="between 13 and 120"):
+            UserUpdate(date_of_birth=date(2013, 10, 17))
+
+    def test_age_120_is_accepted(self, today):
+        """Test the last day of being 120 is still allowed."""
+        today(date(2026, 10, 16))
+
+        user = UserUpdate(date_of_birth=date(1905, 10, 17))
+
+        assert user.date_of_birth == date(1905, 10, 17)
+
+    def test_age_121_is_rejected(self, today):
+        """Test a user turning 121 today is too old."""
+        today(date(2026, 10, 16))
+
+        with pytest.raises(ValidationError, match="between 13 and 120"):
+            UserUpdate(date_of_birth=date(1905, 10, 16))
+
+    def test_feb_29_birthday_in_non_leap_year(self, today):
+        """Test a Feb 29 birthday counts from Mar 1 in non-leap years."""
+        today(date(2025, 2, 28))
+        with pytest.raises(ValidationError, match="between 13 and 120"):
+            UserUpdate(date_of_birth=date(2012, 2, 29))
+
+        today(date(2025, 3, 1))
+        user = UserUpdate(date_of_birth=date(2012, 2, 29))
+
+        assert user.date_of_birth == date(2012, 2, 29)
+
+    def test_create_uses_same_bounds(self, today):
+        """Test UserCreate applies the same check as UserUpdate."""
+        today(date(2026, 10, 16))
+        fields = {
+            "email": "bounds@example.com",
+            "password": "securepassword",
+            "full_name": "Bounds User",
+            "gender": Gender.FEMALE,
+            "height_cm": 165,
+            "preferred_calculation_method": CalculationMethod.NAVY,
+            "activity_level": ActivityLevel.SEDENTARY,
+        }
+
+        assert UserCreate(**fields, date_of_birth=date(2013, 10, 16))
+        with pytest.raises(ValidationError, match="between 13 and 120"):
+            UserCreate(**fields, date_of_birth=date(2013, 10, 17))